@@ -1,5 +1,15 @@
+import hashlib
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# benchmark_metadata and save_and_compare come from src/benchmark_report.py, which only defines
+# helpers; the mitigation suite in src/benchmark_suite.py does not need to run first
+
 try:
-    from skopt import gp_minimize
+    from skopt import Optimizer, gp_minimize
     from skopt.space import Real
     SKOPT_AVAILABLE = True
 except ImportError:
@@ -27,32 +37,192 @@ objective_bench.set_search_space(search_space_bench)
 num_configs_bench = 8 * 8
 max_evaluations = 60
 
-def evaluate_config_sklearn(config_dict):
+def dataset_fingerprint(estimator_class, *arrays):
+    digest = hashlib.blake2b(estimator_class.__name__.encode(), digest_size=16)
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.shape}|{array.dtype.str}".encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+class EvaluationCache:
+
+    def __init__(self, path, fingerprint):
+        self.path = path
+        self.fingerprint = fingerprint
+        self._scores = {}
+        self.hits = 0
+        self.misses = 0
+        if os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    record = json.loads(line)
+                    # entries from other datasets or estimators share the file but never match
+                    if record['fingerprint'] == fingerprint:
+                        self._scores[record['config']] = record['score']
+
+    @staticmethod
+    def key(config_dict):
+        return json.dumps({name: value.item() if isinstance(value, np.generic) else value
+                           for name, value in config_dict.items()}, sort_keys=True)
+
+    def __contains__(self, config_dict):
+        return self.key(config_dict) in self._scores
+
+    def get(self, config_dict):
+        score = self._scores.get(self.key(config_dict))
+        if score is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return score
+
+    def put(self, config_dict, score):
+        key = self.key(config_dict)
+        self._scores[key] = score
+        with open(self.path, 'a') as f:
+            f.write(json.dumps({'fingerprint': self.fingerprint, 'config': key, 'score': score}) + '\n')
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {'size': len(self._scores), 'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups > 0 else 0.0}
+
+def _objective_score(config_dict):
+    # objective_bench's own evaluation, whatever its sign convention; pool workers inherit objective_bench
+    evaluate = getattr(objective_bench, 'evaluate', objective_bench)
+    return evaluate(config_dict)
+
+def search_space_grid(search_space):
+    # the discrete candidates of a search space: num_points evenly spaced values per continuous parameter
+    names = list(search_space)
+    axes = [np.linspace(d["low"], d["high"], d["num_points"]) if d["type"] == "continuous" else d["values"]
+            for d in search_space.values()]
+    return [dict(zip(names, values)) for values in itertools.product(*axes)]
+
+class BenchmarkObjective:
+    # objective_bench's evaluation path with the on-disk cache and an optional process pool in front;
+    # search-space handling and everything else QHBO asks of the objective is delegated to the wrapped
+    # SklearnObjective
+
+    def __init__(self, objective, cache=None, pool=None):
+        self._objective = objective
+        self.cache = cache
+        self.pool = pool
+        self._pending = {}
+        self.evaluations = 0
+
+    def __getattr__(self, name):
+        return getattr(self._objective, name)
+
+    def prefetch(self, configs):
+        # QHBO evaluates its samples one call at a time; submitting the candidates up front lets the
+        # pool fit them ahead of its loop, and each call then only waits for its own result
+        for config in configs:
+            key = EvaluationCache.key(config)
+            if key not in self._pending and (self.cache is None or config not in self.cache):
+                self._pending[key] = self.pool.submit(_objective_score, config)
+
+    def evaluate(self, config_dict):
+        if self.cache is not None:
+            score = self.cache.get(config_dict)
+            if score is not None:
+                return score
+        future = self._pending.pop(EvaluationCache.key(config_dict), None)
+        score = future.result() if future is not None else _objective_score(config_dict)
+        self.evaluations += 1
+        if self.cache is not None:
+            self.cache.put(config_dict, score)
+        return score
+
+    def close(self):
+        # returns the number of prefetched candidates QHBO never asked for
+        unused = len(self._pending)
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        return unused
+
+    __call__ = evaluate
+
+evaluation_cache = EvaluationCache('evaluation_cache.jsonl',
+                                   dataset_fingerprint(SVC, X_train_w, y_train_w, X_test_w, y_test_w))
+# SklearnObjective scores in its own convention, so its entries get their own fingerprint
+objective_cache = EvaluationCache('evaluation_cache.jsonl',
+                                  dataset_fingerprint(type(objective_bench), X_train_w, y_train_w, X_test_w, y_test_w))
+
+# a fixed permutation, so every subsample of a given size is the same rows for every config
+_train_order = np.random.default_rng(0).permutation(len(y_train_w))
+
+def evaluate_config_sklearn(config_dict, cache=None, train_fraction=1.0):
+    # timed benchmark runs leave the cache off, so their times measure fits rather than lookups
+    # low-fidelity scores are cached separately; full-fidelity keys stay as before
+    cache_key = config_dict if train_fraction >= 1.0 else {**config_dict, '_train_fraction': train_fraction}
+    if cache is not None:
+        score = cache.get(cache_key)
+        if score is not None:
+            return score
+    rows = slice(None)
+    if train_fraction < 1.0:
+        rows = _train_order[:max(2, int(round(train_fraction * len(_train_order))))]
     try:
-        model = SVC(**config_dict)
-        model.fit(X_train_w, y_train_w)
-        return -model.score(X_test_w, y_test_w)
+        model = SVC(**config_dict).fit(X_train_w[rows], y_train_w[rows])
+        score = -model.score(X_test_w, y_test_w)
     except:
         return 1.0
+    if cache is not None:
+        cache.put(cache_key, score)
+    return score
+
+def successive_halving(configs, eta=3, min_fraction=1/9, cache=None):
+    # rungs use min_fraction, min_fraction * eta, ... of the training data, ending with a full fit
+    num_rungs = int(round(np.log(1 / min_fraction) / np.log(eta))) + 1
+    survivors = list(configs)
+    rungs = []
+    for rung in range(num_rungs):
+        fraction = min(1.0, min_fraction * eta ** rung)
+        scores = [evaluate_config_sklearn(config, cache=cache, train_fraction=fraction) for config in survivors]
+        rungs.append({'fraction': fraction, 'evaluations': len(survivors)})
+        # stable sort keeps the earlier config on ties, as a sequential search would
+        order = np.argsort(scores, kind='stable')
+        if rung == num_rungs - 1:
+            best = order[0]
+            break
+        survivors = [survivors[i] for i in order[:max(1, int(np.ceil(len(survivors) / eta)))]]
+    return {
+        'best_score': -scores[best],
+        'best_config': survivors[best],
+        'evaluations': sum(r['evaluations'] for r in rungs),
+        'full_fidelity_evaluations': sum(r['evaluations'] * r['fraction'] for r in rungs),
+        'rungs': rungs,
+    }
+
+def evaluate_configs_parallel(configs, pool):
+    # map() keeps submission order, so ties resolve exactly as in a sequential loop
+    return list(pool.map(evaluate_config_sklearn, configs))
 
 benchmark_results = {}
 
 print("\n1. QHBO (Quantum Hyperparameter Bayesian Optimization)")
 backend_bench = QiskitBackend(num_qubits=6, noise_model=None)
-optimizer_bench = QHBOOptimizer(
-    objective=objective_bench,
-    backend=backend_bench,
-    max_iterations=25,
-    num_samples_per_iteration=None,
-    verbose=False,
-    show_quantum_details=False,
-    learning_rate=0.4,
-    entropy_regularization=0.03
-)
-
-start_time = time.time()
+
+def make_qhbo(objective):
+    return QHBOOptimizer(
+        objective=objective,
+        backend=backend_bench,
+        max_iterations=25,
+        num_samples_per_iteration=None,
+        verbose=False,
+        show_quantum_details=False,
+        learning_rate=0.4,
+        entropy_regularization=0.03
+    )
+
+optimizer_bench = make_qhbo(objective_bench)
+
+start_time = time.perf_counter()
 results_qhbo_bench = optimizer_bench.optimize()
-qhbo_time = time.time() - start_time
+qhbo_time = time.perf_counter() - start_time
 qhbo_evals = results_qhbo_bench['num_iterations'] * optimizer_bench.num_samples_per_iteration
 
 benchmark_results['QHBO'] = {
@@ -77,7 +247,7 @@ if SKOPT_AVAILABLE:
         config = {'C': params[0], 'gamma': params[1]}
         return evaluate_config_sklearn(config)
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     result_skopt = gp_minimize(
         objective_skopt,
         space_skopt,
@@ -85,7 +255,7 @@ if SKOPT_AVAILABLE:
         random_state=42,
         n_jobs=1
     )
-    skopt_time = time.time() - start_time
+    skopt_time = time.perf_counter() - start_time
     
     best_config_skopt = {'C': result_skopt.x[0], 'gamma': result_skopt.x[1]}
     best_score_skopt = -result_skopt.fun
@@ -111,9 +281,9 @@ if OPTUNA_AVAILABLE:
     
     study = optuna.create_study(direction='minimize', sampler=optuna.samplers.TPESampler(seed=42))
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     study.optimize(objective_optuna, n_trials=max_evaluations, show_progress_bar=False)
-    optuna_time = time.time() - start_time
+    optuna_time = time.perf_counter() - start_time
     
     best_score_optuna = -study.best_value
     best_config_optuna = study.best_params
@@ -146,9 +316,9 @@ def random_search_bench(objective, search_space, n_evaluations):
     return best_score, best_config
 
 np.random.seed(42)
-start_time = time.time()
+start_time = time.perf_counter()
 random_score, random_config = random_search_bench(evaluate_config_sklearn, search_space_bench, max_evaluations)
-random_time = time.time() - start_time
+random_time = time.perf_counter() - start_time
 
 benchmark_results['Random Search'] = {
     'score': random_score,
@@ -160,10 +330,133 @@ print(f"  Best score: {random_score:.4f}")
 print(f"  Evaluations: {max_evaluations}")
 print(f"  Time: {random_time:.2f}s")
 
+print("\n5. Parallel candidate evaluation")
+num_workers = os.cpu_count() or 1
+
+# random search: all candidates are drawn up front, in the same order as the sequential loop
+np.random.seed(42)
+random_configs = [
+    {name: np.random.uniform(d["low"], d["high"]) if d["type"] == "continuous" else np.random.choice(d["values"])
+     for name, d in search_space_bench.items()}
+    for _ in range(max_evaluations)
+]
+# one pool for every parallel run, started before timing so worker start-up is not measured
+with ProcessPoolExecutor(max_workers=num_workers) as pool:
+    list(pool.map(abs, range(num_workers)))
+
+    start_time = time.perf_counter()
+    random_scores = evaluate_configs_parallel(random_configs, pool)
+    parallel_random_time = time.perf_counter() - start_time
+    best_index = int(np.argmin(random_scores))
+
+    # wall-clock speedup over the sequential random search of the same configs
+    benchmark_results['Random (parallel)'] = {
+        'score': -random_scores[best_index],
+        'time': parallel_random_time,
+        'evaluations': max_evaluations,
+        'speedup': random_time / parallel_random_time,
+    }
+    print(f"  Random search: {-random_scores[best_index]:.4f} in {parallel_random_time:.2f}s "
+          f"({random_time / parallel_random_time:.2f}x over sequential)")
+
+    if SKOPT_AVAILABLE:
+        # GP-BO with batch updates: ask for one candidate per worker, tell all results at once
+        gp_optimizer = Optimizer(space_skopt, random_state=42)
+        start_time = time.perf_counter()
+        while len(gp_optimizer.yi) < max_evaluations:
+            points = gp_optimizer.ask(n_points=min(num_workers, max_evaluations - len(gp_optimizer.yi)))
+            gp_optimizer.tell(points, evaluate_configs_parallel([{'C': p[0], 'gamma': p[1]} for p in points], pool))
+        parallel_gp_time = time.perf_counter() - start_time
+
+        # against sequential gp_minimize with the same evaluation budget
+        benchmark_results['GP-BO (parallel)'] = {
+            'score': -min(gp_optimizer.yi),
+            'time': parallel_gp_time,
+            'evaluations': max_evaluations,
+            'speedup': skopt_time / parallel_gp_time,
+        }
+        print(f"  GP-BO batch: {-min(gp_optimizer.yi):.4f} in {parallel_gp_time:.2f}s "
+              f"({skopt_time / parallel_gp_time:.2f}x over sequential)")
+
+    # QHBO samples from the search-space grid, so its candidates are fanned out to the pool before
+    # its loop starts; the extra fits for candidates it never samples are part of the measured time
+    parallel_objective = BenchmarkObjective(objective_bench, pool=pool)
+    optimizer_parallel = make_qhbo(parallel_objective)
+    start_time = time.perf_counter()
+    parallel_objective.prefetch(search_space_grid(search_space_bench))
+    results_qhbo_parallel = optimizer_parallel.optimize()
+    parallel_qhbo_time = time.perf_counter() - start_time
+    unused = parallel_objective.close()
+
+    # against the sequential QHBO run with the same settings
+    benchmark_results['QHBO (parallel)'] = {
+        'score': results_qhbo_parallel['best_score'],
+        'time': parallel_qhbo_time,
+        'evaluations': results_qhbo_parallel['num_iterations'] * optimizer_parallel.num_samples_per_iteration,
+        'speedup': qhbo_time / parallel_qhbo_time,
+    }
+    print(f"  QHBO prefetched: {results_qhbo_parallel['best_score']:.4f} in {parallel_qhbo_time:.2f}s "
+          f"({qhbo_time / parallel_qhbo_time:.2f}x over sequential, {unused} candidates unused)")
+
+print("\n6. Successive halving (multi-fidelity random search)")
+# same candidates as random search; uncached, so the wall time reflects real fits
+start_time = time.perf_counter()
+halving = successive_halving(random_configs, eta=3, min_fraction=1/9)
+halving_time = time.perf_counter() - start_time
+
+benchmark_results['Random + SH'] = {
+    'score': halving['best_score'],
+    'time': halving_time,
+    'evaluations': halving['evaluations'],
+    'full_fidelity_evaluations': halving['full_fidelity_evaluations'],
+}
+
+for rung in halving['rungs']:
+    print(f"  {rung['evaluations']} configs on {rung['fraction']:.0%} of the training data")
+print(f"  Best score: {halving['best_score']:.4f}")
+print(f"  Full-fidelity evaluations: {halving['full_fidelity_evaluations']:.1f}")
+print(f"  Time: {halving_time:.2f}s")
+
+print("\n7. Memoized random search")
+# reported as its own row: after the first run its time measures cache lookups, not fits
+start_time = time.perf_counter()
+cached_scores = [evaluate_config_sklearn(config, cache=evaluation_cache) for config in random_configs]
+cached_time = time.perf_counter() - start_time
+
+benchmark_results['Random (cached)'] = {
+    'score': -min(cached_scores),
+    'time': cached_time,
+    'evaluations': max_evaluations,
+}
+
+print(f"  Best score: {-min(cached_scores):.4f}")
+print(f"  Time: {cached_time:.2f}s")
+for key, value in evaluation_cache.stats().items():
+    print(f"  {key}: {value}")
+
+# QHBO through the same cache: repeated samples and repeated runs skip the SVC fit
+cached_objective = BenchmarkObjective(objective_bench, cache=objective_cache)
+optimizer_cached = make_qhbo(cached_objective)
+start_time = time.perf_counter()
+results_qhbo_cached = optimizer_cached.optimize()
+qhbo_cached_time = time.perf_counter() - start_time
+
+benchmark_results['QHBO (cached)'] = {
+    'score': results_qhbo_cached['best_score'],
+    'time': qhbo_cached_time,
+    'evaluations': results_qhbo_cached['num_iterations'] * optimizer_cached.num_samples_per_iteration,
+    'full_fidelity_evaluations': cached_objective.evaluations,
+}
+
+print(f"  QHBO: {results_qhbo_cached['best_score']:.4f} in {qhbo_cached_time:.2f}s "
+      f"({cached_objective.evaluations} fits)")
+for key, value in objective_cache.stats().items():
+    print(f"  {key}: {value}")
+
 print("\n" + "="*70)
 print("Benchmark Summary:")
-print(f"{'Method':<20} {'Score':<12} {'Time (s)':<12} {'Evaluations':<12} {'Score/Time':<12}")
-print("-"*70)
+print(f"{'Method':<20} {'Score':<12} {'Time (s)':<12} {'Evaluations':<12} {'Full-fid.':<10} {'Score/Time':<12} {'Speedup':<8}")
+print("-"*89)
 
 baseline_score = benchmark_results.get('GP-BO', benchmark_results.get('Random Search', {}))['score']
 
@@ -174,7 +467,9 @@ for method, results in benchmark_results.items():
     score_per_time = score / time_val if time_val > 0 else 0
     improvement = score - baseline_score
     
-    print(f"{method:<20} {score:<12.4f} {time_val:<12.2f} {evals:<12} {score_per_time:<12.4f}")
+    full_fidelity = results.get('full_fidelity_evaluations', evals)
+    print(f"{method:<20} {score:<12.4f} {time_val:<12.2f} {evals:<12} {full_fidelity:<10.1f} {score_per_time:<12.4f} "
+          f"{results.get('speedup', 1.0):<8.2f}")
 
 if len(benchmark_results) > 1:
     best_method = max(benchmark_results.items(), key=lambda x: x[1]['score'])
@@ -189,3 +484,16 @@ if len(benchmark_results) > 1:
             deficit = baseline_score - qhbo_score
             print(f"QHBO deficit vs baseline: -{deficit:.4f} ({deficit/baseline_score*100:.2f}% relative)")
             print("Note: Quantum advantage may emerge on larger problems or with different hyperparameters")
+
+# machine-readable results, compared against the previous run
+classical_report = {
+    'meta': benchmark_metadata({'max_evaluations': max_evaluations, 'search_space': search_space_bench}),
+    'cases': [
+        {'benchmark': f"hpo_{method}", 'score': float(results['score']), 'time_s': results['time'],
+         'evaluations': int(results['evaluations']),
+         'full_fidelity_evaluations': float(results.get('full_fidelity_evaluations', results['evaluations'])),
+         'speedup': results.get('speedup', 1.0)}
+        for method, results in benchmark_results.items()
+    ],
+}
+save_and_compare(classical_report, 'classical_benchmark.json', 'classical_benchmark_baseline.json')
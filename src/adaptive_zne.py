@@ -0,0 +1,74 @@
+# Adaptive shot allocation for ZNE
+from scipy.stats import norm
+
+
+def execute_adaptive_zne(circuit, scale_factors=(1, 3, 5), total_shots=16384, pilot_shots=256,
+                         target_half_width=0.02, confidence=0.95, backend=None):
+    if total_shots < len(scale_factors):
+        raise ValueError(f"total_shots must cover at least one shot per scale factor, got {total_shots}")
+    simulator = backend if backend is not None else AerSimulator()
+    z = norm.ppf(0.5 + confidence / 2)
+    coefficients = richardson_coefficients(scale_factors)
+    variants = transpile([fold_circuit(circuit, scale) for scale in scale_factors], simulator, optimization_level=0)
+
+    signed_sums = np.zeros(len(scale_factors))
+    shots_used = np.zeros(len(scale_factors), dtype=np.int64)
+
+    def run(allocation):
+        jobs = [(i, simulator.run(variants[i], shots=int(shots)))
+                for i, shots in enumerate(allocation) if shots > 0]
+        for i, job in jobs:
+            outcomes, weights = counts_to_arrays(job.result().get_counts())
+            signed_sums[i] += weights @ parity_signs(outcomes)
+            shots_used[i] += weights.sum()
+
+    run(np.full(len(scale_factors), min(pilot_shots, total_shots // len(scale_factors))))
+    rounds = 1
+
+    while True:
+        means = signed_sums / shots_used
+        # parity outcomes are +-1, so the per-shot variance is 1 - <P>^2
+        sigmas = np.sqrt(np.clip(1 - means ** 2, 1e-12, None))
+        std_error = np.sqrt(np.sum(coefficients ** 2 * sigmas ** 2 / shots_used))
+        remaining = total_shots - shots_used.sum()
+        if z * std_error <= target_half_width or remaining <= 0:
+            break
+
+        # Neyman allocation: n_i ~ |c_i| sigma_i minimises the variance of sum c_i <P_i>
+        weights = np.abs(coefficients) * sigmas
+        shots_for_target = (z * weights.sum() / target_half_width) ** 2
+        # grow at most 2x per round, since the variance estimates are still noisy
+        next_total = min(shots_for_target, 2 * shots_used.sum(), total_shots)
+        allocation = np.floor(next_total * weights / weights.sum()).astype(np.int64) - shots_used
+        allocation = np.clip(allocation, 0, None)
+        if allocation.sum() > remaining:
+            allocation = np.floor(allocation * remaining / allocation.sum()).astype(np.int64)
+        if allocation.sum() == 0:
+            break
+
+        run(allocation)
+        rounds += 1
+
+    expectation_value = float(coefficients @ means)
+    half_width = z * std_error
+    return {
+        'strategy': 'ZNE',
+        'expectation_value': expectation_value,
+        'unmitigated_expectation': float(means[int(np.argmin(scale_factors))]),
+        'std_error': float(std_error),
+        'confidence_interval': (expectation_value - half_width, expectation_value + half_width),
+        'converged': bool(half_width <= target_half_width),
+        'scale_factors': list(scale_factors),
+        'noisy_expectations': means.tolist(),
+        'shots_per_scale': shots_used.tolist(),
+        'shots': int(shots_used.sum()),
+        'rounds': rounds,
+    }
+
+
+adaptive_result = execute_adaptive_zne(test_circuit, total_shots=16384, target_half_width=0.02)
+print("Adaptive ZNE:")
+print(f"  Expectation value: {adaptive_result['expectation_value']:.4f} ± {adaptive_result['std_error']:.4f}")
+print(f"  Converged: {adaptive_result['converged']} after {adaptive_result['rounds']} rounds")
+print(f"  Shots per scale factor: {dict(zip(adaptive_result['scale_factors'], adaptive_result['shots_per_scale']))}")
+print(f"  Shots used: {adaptive_result['shots']} of 16384")
@@ -0,0 +1,228 @@
+# Asyncio service front-end with request coalescing
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+
+class _Stage:
+
+    def __init__(self, name, max_pending, history=10000):
+        self.name = name
+        self.queue = asyncio.Queue(maxsize=max_pending)
+        self.latencies = deque(maxlen=history)
+        self.batch_sizes = deque(maxlen=history)
+        self.task = None
+        # requests taken off the queue but not yet resolved or handed to a batch task
+        self.current = []
+
+    def fail_pending(self, error):
+        pending = self.current
+        self.current = []
+        while not self.queue.empty():
+            pending.append(self.queue.get_nowait())
+        for _, future, _ in pending:
+            if not future.done():
+                future.set_exception(error)
+
+    def stats(self):
+        latencies = np.array(self.latencies) * 1e3 if self.latencies else np.zeros(1)
+        return {
+            'queue_depth': self.queue.qsize(),
+            'requests': len(self.latencies),
+            'batches': len(self.batch_sizes),
+            'mean_batch_size': float(np.mean(self.batch_sizes)) if self.batch_sizes else 0.0,
+            'latency_p50_ms': float(np.percentile(latencies, 50)),
+            'latency_p90_ms': float(np.percentile(latencies, 90)),
+            'latency_p99_ms': float(np.percentile(latencies, 99)),
+        }
+
+
+class AsyncSuppressorService:
+
+    def __init__(self, suppressor, selector=None, batch_window=0.005, max_batch_size=64,
+                 max_workers=2, max_pending=1024):
+        self.suppressor = suppressor
+        self.selector = selector
+        self.compiled_selector = compile_classifier(selector) if selector is not None else None
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.stages = {}
+        self._pool = None
+        self._inflight = None
+        self._inflight_batches = 0
+        self._batch_tasks = set()
+        self._closing = False
+
+    async def start(self):
+        self._closing = False
+        self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        # one simulation batch per worker; further requests wait in the bounded queue
+        self._inflight = asyncio.Semaphore(self.max_workers)
+        self.stages = {
+            'predict': _Stage('predict', self.max_pending),
+            'execute': _Stage('execute', self.max_pending),
+        }
+        self.stages['predict'].task = asyncio.create_task(self._run_predict_stage(self.stages['predict']))
+        self.stages['execute'].task = asyncio.create_task(self._run_execute_stage(self.stages['execute']))
+        return self
+
+    async def stop(self):
+        self._closing = True
+        tasks = [stage.task for stage in self.stages.values() if stage.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # queued requests and the batch a cancelled stage was holding would otherwise never resolve
+        for stage in self.stages.values():
+            stage.fail_pending(RuntimeError("AsyncSuppressorService stopped"))
+        await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def predict(self, circuit):
+        return await self._submit('predict', circuit)
+
+    async def execute(self, circuit, strategy='ZNE', shots=1024):
+        return await self._submit('execute', (circuit, strategy, shots))
+
+    def stats(self):
+        stats = {name: stage.stats() for name, stage in self.stages.items()}
+        stats['execute']['inflight_batches'] = self._inflight_batches
+        return stats
+
+    async def _submit(self, stage_name, payload):
+        if self._closing:
+            raise RuntimeError("AsyncSuppressorService stopped")
+        future = asyncio.get_running_loop().create_future()
+        # put() blocks once max_pending requests are queued: that is the backpressure
+        await self.stages[stage_name].queue.put((payload, future, time.perf_counter()))
+        if self._closing and not future.done():
+            # stop() may already have drained the queue; nothing will pick this request up
+            future.set_exception(RuntimeError("AsyncSuppressorService stopped"))
+        return await future
+
+    async def _collect(self, stage):
+        # the batch is built in stage.current so that stop() can fail it if this task is cancelled
+        loop = asyncio.get_running_loop()
+        batch = stage.current = []
+        batch.append(await stage.queue.get())
+        deadline = loop.time() + self.batch_window
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(stage.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    def _resolve(self, stage, batch, results):
+        now = time.perf_counter()
+        for (_, future, enqueued), result in zip(batch, results):
+            stage.latencies.append(now - enqueued)
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _run_predict_stage(self, stage):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect(stage)
+            stage.batch_sizes.append(len(batch))
+            circuits = [payload for payload, _, _ in batch]
+            try:
+                results = await loop.run_in_executor(None, self._predict_batch, circuits)
+            except Exception as e:
+                results = [e] * len(batch)
+            self._resolve(stage, batch, results)
+            stage.current = []
+
+    def _predict_batch(self, circuits):
+        if self.selector is None:
+            return [self.suppressor.predict_mitigation_strategy(circuit) for circuit in circuits]
+
+        prediction = predict_mitigation_strategy_batch(circuits, self.selector, compiled=self.compiled_selector)
+        classes = prediction['classes'].tolist()
+        results = []
+        for probabilities, argmax, top in zip(prediction['probabilities'], prediction['argmax'], prediction['top_k']):
+            results.append({
+                'recommended_strategy': classes[argmax],
+                'strategy_probabilities': dict(zip(classes, probabilities.tolist())),
+                'top_strategies': [(classes[i], float(probabilities[i])) for i in top],
+            })
+        return results
+
+    async def _run_execute_stage(self, stage):
+        while True:
+            await self._inflight.acquire()
+            try:
+                batch = await self._collect(stage)
+            except BaseException:
+                self._inflight.release()
+                raise
+            stage.batch_sizes.append(len(batch))
+            self._inflight_batches += 1
+            task = asyncio.create_task(self._execute_batch(stage, batch))
+            # the batch task now owns these requests; stop() awaits it rather than failing them
+            stage.current = []
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _execute_batch(self, stage, batch):
+        loop = asyncio.get_running_loop()
+        try:
+            # one Aer job per (strategy, shots) group within the micro-batch
+            groups = {}
+            for position, ((circuit, strategy, shots), _, _) in enumerate(batch):
+                groups.setdefault((strategy, shots), []).append((position, circuit))
+
+            futures = {
+                key: loop.run_in_executor(self._pool, execute_batch_with_mitigation,
+                                          [circuit for _, circuit in members], key[0], key[1])
+                for key, members in groups.items()
+            }
+            results = [None] * len(batch)
+            for key, members in groups.items():
+                try:
+                    group_results = await futures[key]
+                except Exception as e:
+                    group_results = [e] * len(members)
+                for (position, _), result in zip(members, group_results):
+                    results[position] = result
+            self._resolve(stage, batch, results)
+        finally:
+            self._inflight_batches -= 1
+            self._inflight.release()
+
+
+async def run_service_demo():
+    async with AsyncSuppressorService(suppressor, selector=model_bundle['strategy_selector']) as service:
+        recommendations = await asyncio.gather(*(service.predict(c) for c in training_circuits))
+        executions = await asyncio.gather(*(service.execute(c, 'ZNE', 512) for c in training_circuits[:10]))
+
+        print("Async Service:")
+        print(f"  Recommendations: {len(recommendations)}")
+        print(f"  Executions: {sum(1 for r in executions if 'error' not in r)}/{len(executions)} successful")
+        for name, stats in service.stats().items():
+            print(f"  {name}: {stats}")
+
+
+try:
+    asyncio.get_running_loop()
+    print("Event loop already running: use `await run_service_demo()`")
+except RuntimeError:
+    asyncio.run(run_service_demo())
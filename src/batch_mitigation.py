@@ -0,0 +1,213 @@
+# Batched mitigation: one AerSimulator job per batch
+from contextlib import nullcontext
+
+from qiskit import QuantumCircuit, transpile
+from qiskit_aer import AerSimulator
+
+
+def unitary_part(circuit):
+    # quantum registers only: an idle classical register left behind by remove_final_measurements
+    # would otherwise widen every outcome of the measure_all() added afterwards
+    unitary = circuit.remove_final_measurements(inplace=False)
+    stripped = QuantumCircuit(*unitary.qregs) if unitary.qregs else QuantumCircuit(unitary.qubits)
+    stripped.global_phase = unitary.global_phase
+    for instruction, qargs, cargs in unitary.data:
+        if cargs:
+            raise ValueError(f"Mid-circuit '{instruction.name}' on classical bits is not supported")
+        stripped.append(instruction, qargs)
+    return stripped
+
+
+def fold_circuit(circuit, scale_factor):
+    # global unitary folding U (U^dag U)^k, measurements are re-added at the end
+    folds, remainder = divmod(scale_factor - 1, 2)
+    if scale_factor < 1 or remainder != 0 or int(scale_factor) != scale_factor:
+        raise ValueError(f"Scale factor must be an odd integer >= 1, got {scale_factor}")
+
+    unitary = unitary_part(circuit)
+    folded = unitary.copy()
+    if folds:
+        inverse = unitary.inverse()
+        for _ in range(int(folds)):
+            folded.compose(inverse, inplace=True)
+            folded.compose(unitary, inplace=True)
+    folded.measure_all()
+    return folded
+
+
+def richardson_coefficients(scale_factors):
+    scales = np.asarray(scale_factors, dtype=float)
+    coefficients = np.ones(len(scales))
+    for i in range(len(scales)):
+        others = np.delete(scales, i)
+        coefficients[i] = np.prod(others / (others - scales[i]))
+    return coefficients
+
+
+def _fold_spec(spec):
+    # spec: (circuit, scale_factor) or (circuit, scale_factor, parameter_values)
+    folded = fold_circuit(spec[0], spec[1])
+    if len(spec) > 2 and spec[2] is not None:
+        folded = folded.assign_parameters(spec[2])
+    return folded
+
+
+def _zne_prepare(circuit, shared, simulator, scale_factors=(1, 3, 5), parameter_values=None, **options):
+    specs = [(circuit, scale, parameter_values) for scale in scale_factors]
+    return specs, {'scale_factors': tuple(scale_factors)}
+
+
+def _zne_finalize(counts_list, context, shared_counts, shots):
+    scale_factors = context['scale_factors']
+    noisy_expectations = batch_parity_expectations(counts_list)
+    coefficients = richardson_coefficients(scale_factors)
+    return {
+        'strategy': 'ZNE',
+        'expectation_value': float(coefficients @ noisy_expectations),
+        'unmitigated_expectation': float(noisy_expectations[int(np.argmin(scale_factors))]),
+        'scale_factors': list(scale_factors),
+        'noisy_expectations': noisy_expectations.tolist(),
+        'shots': shots * len(scale_factors),
+    }
+
+
+def _mem_prepare(circuit, shared, simulator, store=None, **options):
+    if store is None:
+        store = calibration_store
+    qubits = tuple(range(circuit.num_qubits))
+    key = store.key(simulator, qubits)
+    # a fresh entry is captured now, so its expiry before finalize cannot leave the batch without one
+    entry = None if key in shared else store.get(key)
+    if entry is None and key not in shared:
+        shared[key] = store.calibration_circuits(qubits)
+    return [(circuit, 1)], {'calibration_key': key, 'store': store, 'calibration': entry}
+
+
+def _mem_finalize(counts_list, context, shared_counts, shots):
+    store = context['store']
+    key = context['calibration_key']
+    entry = context['calibration']
+    if entry is None:
+        # calibration counts were submitted with this batch; the first circuit builds the entry
+        entry = store.get(key) or store.build(key, shared_counts[key])
+
+    num_bits = entry['num_bits']
+    if entry['method'] == 'tensored' and num_bits > store.max_dense_bits:
+        mitigated = store.parity_expectation(entry, counts_list[0])
+    else:
+        corrected = store.apply(entry, counts_to_probability_matrix(counts_list, num_bits))
+        mitigated = float(corrected[0] @ parity_signs(np.arange(2 ** num_bits)))
+    return {
+        'strategy': 'MEM',
+        'expectation_value': mitigated,
+        'unmitigated_expectation': parity_expectation(counts_list[0]),
+        'shots': shots,
+    }
+
+
+def _stage(profiler, name, circuits=0, shots=0):
+    return profiler.stage(name, circuits=circuits, shots=shots) if profiler is not None else nullcontext()
+
+
+BATCH_STRATEGIES = {
+    'ZNE': (_zne_prepare, _zne_finalize),
+    'MEM': (_mem_prepare, _mem_finalize),
+}
+
+
+def execute_batch_with_mitigation(circuits, strategy='ZNE', shots=1024, backend=None, folding_cache=None,
+                                  profiler=None, router=None, **options):
+    circuits = list(circuits)
+    call = profiler.call('execute_batch_with_mitigation', len(circuits), shots) if profiler is not None else nullcontext()
+    with call:
+        return _execute_batch(circuits, strategy, shots, backend, folding_cache, profiler, router, options)
+
+
+def _execute_batch(circuits, strategy, shots, backend, folding_cache, profiler, router, options):
+    if strategy not in BATCH_STRATEGIES:
+        # no native batch path: one execute_with_mitigation call per circuit
+        results = []
+        for circuit in circuits:
+            try:
+                results.append(suppressor.execute_with_mitigation(circuit, strategy=strategy, shots=shots))
+            except Exception as e:
+                results.append({'error': str(e)})
+        return results
+
+    if backend is not None:
+        simulator = backend
+    else:
+        simulator = router.backend if router is not None else AerSimulator()
+    prepare, finalize = BATCH_STRATEGIES[strategy]
+
+    results = [None] * len(circuits)
+    shared = {}
+    jobs = []
+    variants = []
+    variant_methods = []
+    untranspiled = []
+    with _stage(profiler, 'circuit_transformation', circuits=len(circuits)):
+        for index, circuit in enumerate(circuits):
+            method = None
+            try:
+                specs, context = prepare(circuit, shared, simulator, **options)
+                if folding_cache is not None:
+                    target = simulator
+                    if router is not None:
+                        # folding keeps the gate set and width, so variants share the circuit's route;
+                        # cached templates are then transpiled for the simulator they will run on
+                        method = router.route([circuit])[0]
+                        target = router.simulator(method)
+                    circuit_variants = folding_cache.get_many(specs, target)
+                else:
+                    circuit_variants = [_fold_spec(spec) for spec in specs]
+            except Exception as e:
+                results[index] = {'error': str(e)}
+                continue
+            if folding_cache is None:
+                untranspiled.extend(range(len(variants), len(variants) + len(circuit_variants)))
+            jobs.append((index, len(variants), len(circuit_variants), context))
+            variants.extend(circuit_variants)
+            variant_methods.extend([method] * len(circuit_variants))
+
+        # calibration circuits shared by several circuits are only submitted once
+        shared_slices = {}
+        for key, shared_circuits in shared.items():
+            shared_slices[key] = (len(variants), len(shared_circuits))
+            untranspiled.extend(range(len(variants), len(variants) + len(shared_circuits)))
+            variants.extend(shared_circuits)
+            variant_methods.extend([None] * len(shared_circuits))
+
+    if not variants:
+        return results
+
+    methods = None
+    try:
+        if router is not None:
+            # each method group is transpiled against, and run on, its own simulator
+            counts, methods = router.run(variants, shots, needs_transpile=set(untranspiled), profiler=profiler,
+                                         methods=variant_methods)
+        else:
+            if untranspiled:
+                with _stage(profiler, 'transpilation', circuits=len(untranspiled)):
+                    transpiled = transpile([variants[i] for i in untranspiled], simulator, optimization_level=0)
+                for i, circuit in zip(untranspiled, transpiled):
+                    variants[i] = circuit
+            with _stage(profiler, 'simulation', circuits=len(variants), shots=shots * len(variants)):
+                job_result = simulator.run(variants, shots=shots).result()
+                counts = [job_result.get_counts(i) for i in range(len(variants))]
+    except Exception as e:
+        for index, _, _, _ in jobs:
+            results[index] = {'error': str(e)}
+        return results
+
+    shared_counts = {key: counts[start:start + length] for key, (start, length) in shared_slices.items()}
+    with _stage(profiler, 'post_processing', circuits=len(jobs)):
+        for index, start, length, context in jobs:
+            try:
+                results[index] = finalize(counts[start:start + length], context, shared_counts, shots)
+                if methods is not None:
+                    results[index]['simulation_methods'] = sorted(set(methods[start:start + length]))
+            except Exception as e:
+                results[index] = {'error': str(e)}
+    return results
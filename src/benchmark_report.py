@@ -0,0 +1,76 @@
+# Benchmark report format and baseline comparison (definitions only, no benchmarks are run)
+import json
+import os
+import platform
+import time
+
+import numpy as np
+import qiskit
+
+BENCHMARK_FORMAT_VERSION = 1
+CASE_KEYS = ('benchmark', 'width', 'depth', 'batch_size')
+# direction in which each metric improves
+BENCHMARK_METRICS = {
+    'latency_p50_ms': 'lower',
+    'latency_p99_ms': 'lower',
+    'throughput_per_s': 'higher',
+    'peak_rss_mb': 'lower',
+    'time_s': 'lower',
+    'score': 'higher',
+}
+
+
+def benchmark_metadata(config=None):
+    return {
+        'format_version': BENCHMARK_FORMAT_VERSION,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': np.__version__,
+        'qiskit': qiskit.__version__,
+        'config': config or {},
+    }
+
+
+def compare_benchmarks(current, baseline, tolerance=0.10):
+    baseline_cases = {tuple(case.get(k) for k in CASE_KEYS): case for case in baseline['cases']}
+    regressions = []
+    for case in current['cases']:
+        reference = baseline_cases.get(tuple(case.get(k) for k in CASE_KEYS))
+        if reference is None:
+            continue
+        for metric, direction in BENCHMARK_METRICS.items():
+            if case.get(metric) is None or not reference.get(metric):
+                continue
+            change = (case[metric] - reference[metric]) / abs(reference[metric])
+            if (direction == 'lower' and change > tolerance) or (direction == 'higher' and change < -tolerance):
+                regressions.append({
+                    **{k: case.get(k) for k in CASE_KEYS},
+                    'metric': metric,
+                    'baseline': reference[metric],
+                    'current': case[metric],
+                    'change': change,
+                })
+    return regressions
+
+
+def print_regressions(regressions):
+    if not regressions:
+        print("No regressions against baseline")
+        return
+    print(f"{len(regressions)} regressions against baseline:")
+    for r in regressions:
+        print(f"  {r['benchmark']} w={r['width']} d={r['depth']} b={r['batch_size']} {r['metric']}: "
+              f"{r['baseline']:.4g} -> {r['current']:.4g} ({r['change'] * 100:+.1f}%)")
+
+
+def save_and_compare(report, output_path, baseline_path):
+    with open(output_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    if os.path.exists(baseline_path):
+        with open(baseline_path) as f:
+            print_regressions(compare_benchmarks(report, json.load(f)))
+    else:
+        with open(baseline_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved as new baseline '{baseline_path}'")
@@ -0,0 +1,116 @@
+# Reproducible benchmark suite (report helpers live in benchmark_report.py)
+import json
+import multiprocessing
+import resource
+import time
+
+from qiskit.circuit.random import random_circuit
+
+
+def _report_peak_rss(run, connection):
+    # forking resets the high-water mark to the resident set inherited from the parent
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    try:
+        run()
+        # ru_maxrss is in KiB on Linux
+        connection.send((resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline) / 1024)
+    finally:
+        connection.close()
+
+
+def peak_rss_mb(run, timeout=600.0):
+    # growth of the resident set during one run of this case alone, in a forked child: unlike
+    # tracemalloc this includes native allocations such as Aer's simulator state; a separate, untimed run.
+    # None if the child fails or times out
+    context = multiprocessing.get_context('fork')
+    receiver, sender = context.Pipe(duplex=False)
+    child = context.Process(target=_report_peak_rss, args=(run, sender), daemon=True)
+    child.start()
+    sender.close()
+    try:
+        peak = receiver.recv() if receiver.poll(timeout) else None
+    except EOFError:
+        peak = None
+    finally:
+        receiver.close()
+        if child.is_alive():
+            child.terminate()
+        child.join()
+    return peak
+
+
+def benchmark_circuits(width, depth, batch_size, seed):
+    return [random_circuit(width, depth, max_operands=2, measure=True, seed=seed + i) for i in range(batch_size)]
+
+
+def _measure(run, items, repeats):
+    run()  # warm-up, not timed
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        latencies.append(time.perf_counter() - start)
+    latencies = np.array(latencies)
+    return {
+        'items': items,
+        'repeats': repeats,
+        'latency_p50_ms': float(np.percentile(latencies, 50) * 1e3),
+        'latency_p90_ms': float(np.percentile(latencies, 90) * 1e3),
+        'latency_p99_ms': float(np.percentile(latencies, 99) * 1e3),
+        'throughput_per_s': float(items / np.median(latencies)),
+        'peak_rss_mb': peak_rss_mb(run),
+    }
+
+
+def run_benchmark_suite(widths=(2, 4, 8), depths=(4, 16), batch_sizes=(1, 32), shots=256, repeats=5,
+                        seed=1234, strategies=('ZNE', 'MEM', 'PEC', 'CDR'), model_path='my_model_bundle',
+                        output_path=None):
+    config = {'widths': list(widths), 'depths': list(depths), 'batch_sizes': list(batch_sizes),
+              'shots': shots, 'repeats': repeats, 'seed': seed, 'strategies': list(strategies)}
+    simulator = AerSimulator(seed_simulator=seed)
+    cases = []
+
+    def add_case(benchmark, width, depth, batch_size, run, items):
+        case = {'benchmark': benchmark, 'width': width, 'depth': depth, 'batch_size': batch_size}
+        case.update(_measure(run, items, repeats))
+        cases.append(case)
+        print(f"  {benchmark:<22} w={str(width):<4} d={str(depth):<4} b={batch_size:<4} "
+              f"p50 {case['latency_p50_ms']:9.2f} ms  {case['throughput_per_s']:10.1f}/s")
+
+    for width in widths:
+        for depth in depths:
+            for batch_size in batch_sizes:
+                circuits = benchmark_circuits(width, depth, batch_size, seed)
+                add_case('feature_extraction', width, depth, batch_size,
+                         lambda: extract_features_batch(circuits), batch_size)
+                add_case('inference', width, depth, batch_size,
+                         lambda: predict_mitigation_strategy_batch(circuits, strategy_selector, compiled=compiled_selector),
+                         batch_size)
+
+                for strategy in strategies:
+                    if strategy in ('ZNE', 'MEM'):
+                        run = lambda: execute_batch_with_mitigation(circuits, strategy, shots, backend=simulator)
+                    elif strategy == 'PEC':
+                        # no backend: execute_pec simulates the noise pec_model describes
+                        run = lambda: [execute_pec(c, pec_model, num_samples=32, shots_per_sample=shots // 32,
+                                                   seed=seed) for c in circuits]
+                    elif strategy == 'CDR':
+                        # a fresh cache per run measures the cold path, including stabilizer simulation
+                        run = lambda: execute_cdr_batch(circuits, CDRTrainingCache(seed=seed), shots, backend=simulator)
+                    else:
+                        raise ValueError(f"Unknown strategy {strategy!r}")
+                    add_case(f"mitigation_{strategy}", width, depth, batch_size, run, batch_size)
+
+    add_case('model_loading', None, None, 1,
+             lambda: [ModelBundle(model_path)[name] for name in ('noise_predictor', 'strategy_selector')], 1)
+
+    report = {'meta': benchmark_metadata(config), 'cases': cases}
+    if output_path is not None:
+        with open(output_path, 'w') as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+print("Benchmark Suite:")
+benchmark_report = run_benchmark_suite()
+save_and_compare(benchmark_report, 'benchmark_results.json', 'benchmark_baseline.json')
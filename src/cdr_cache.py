@@ -0,0 +1,137 @@
+# Clifford data regression with cached training sets
+from collections import OrderedDict
+
+from qiskit.quantum_info import Clifford, Pauli, StabilizerState
+
+CDR_BASIS_GATES = ['rz', 'sx', 'x', 'cx']
+# rz(k * pi/2) up to a global phase
+QUARTER_TURN_GATES = {1: 's', 2: 'z', 3: 'sdg'}
+
+
+def _cliffordize(base, rng):
+    # every rz is snapped to a neighbouring multiple of pi/2, the closer one being more likely
+    variant = base.copy_empty_like()
+    for instruction, qargs, cargs in base.data:
+        if instruction.name != 'rz':
+            variant.append(instruction, qargs, cargs)
+            continue
+        quarter = float(instruction.params[0]) / (np.pi / 2)
+        lower = np.floor(quarter)
+        k = int(lower + (rng.random() < quarter - lower)) % 4
+        if k:
+            getattr(variant, QUARTER_TURN_GATES[k])(qargs[0])
+    return variant
+
+
+class CDRTrainingCache:
+
+    def __init__(self, num_training=16, maxsize=256, seed=0):
+        self.num_training = num_training
+        self.maxsize = maxsize
+        self.seed = seed
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _build(self, circuit):
+        base = transpile(circuit.remove_final_measurements(inplace=False),
+                         basis_gates=CDR_BASIS_GATES, optimization_level=0)
+        rng = np.random.default_rng(self.seed)
+        observable = Pauli('Z' * base.num_qubits)
+
+        training = [_cliffordize(base, rng) for _ in range(self.num_training)]
+        # exact ideal values from the stabilizer simulator
+        ideal = np.array([StabilizerState(Clifford(t)).expectation_value(observable) for t in training])
+
+        target = base.copy()
+        target.measure_all()
+        for t in training:
+            t.measure_all()
+        return {'circuits': [target] + training, 'ideal': ideal, 'transpiled': {}}
+
+    def get(self, circuit):
+        key = circuit_structural_hash(circuit)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = self._entries[key] = self._build(circuit)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return entry
+
+    def stats(self):
+        return {'size': len(self._entries), 'hits': self.hits, 'misses': self.misses,
+                'num_training': self.num_training}
+
+
+def fit_cdr(noisy_training, ideal_training, noisy_target):
+    # row-wise least squares ideal ~ a * noisy + b, one row per circuit
+    x_mean = noisy_training.mean(axis=1, keepdims=True)
+    y_mean = ideal_training.mean(axis=1, keepdims=True)
+    x_centered = noisy_training - x_mean
+    variance = np.sum(x_centered ** 2, axis=1)
+    covariance = np.sum(x_centered * (ideal_training - y_mean), axis=1)
+
+    # degenerate training sets fall back to a constant offset correction
+    degenerate = variance < 1e-12
+    slope = np.where(degenerate, 1.0, covariance / np.where(degenerate, 1.0, variance))
+    intercept = y_mean[:, 0] - slope * x_mean[:, 0]
+    return slope * noisy_target + intercept, slope, intercept
+
+
+def execute_cdr_batch(circuits, cdr_cache, shots=1024, backend=None):
+    simulator = backend if backend is not None else AerSimulator()
+    target_key = backend_target_fingerprint(simulator)
+
+    results = [None] * len(circuits)
+    entries = []
+    for index, circuit in enumerate(circuits):
+        try:
+            entry = cdr_cache.get(circuit)
+            if target_key not in entry['transpiled']:
+                entry['transpiled'][target_key] = transpile(entry['circuits'], simulator, optimization_level=0)
+        except Exception as e:
+            results[index] = {'error': str(e)}
+            continue
+        entries.append((index, entry))
+
+    if not entries:
+        return results
+
+    # only the noisy executions are paid for on a cache hit
+    variants = [c for _, entry in entries for c in entry['transpiled'][target_key]]
+    try:
+        job_result = simulator.run(variants, shots=shots).result()
+    except Exception as e:
+        for index, _ in entries:
+            results[index] = {'error': str(e)}
+        return results
+
+    noisy = batch_parity_expectations([job_result.get_counts(i) for i in range(len(variants))])
+    noisy = noisy.reshape(len(entries), cdr_cache.num_training + 1)
+    ideal = np.stack([entry['ideal'] for _, entry in entries])
+    mitigated, slope, intercept = fit_cdr(noisy[:, 1:], ideal, noisy[:, 0])
+
+    for row, (index, _) in enumerate(entries):
+        results[index] = {
+            'strategy': 'CDR',
+            'expectation_value': float(mitigated[row]),
+            'unmitigated_expectation': float(noisy[row, 0]),
+            'fit': (float(slope[row]), float(intercept[row])),
+            'num_training': cdr_cache.num_training,
+            'shots': shots * (cdr_cache.num_training + 1),
+        }
+    return results
+
+
+cdr_cache = CDRTrainingCache(num_training=16)
+for attempt in range(2):
+    cdr_results = execute_cdr_batch(test_circuits, cdr_cache, shots=1024)
+
+print("CDR Training Cache:")
+print(f"  Circuits mitigated: {sum(1 for r in cdr_results if 'error' not in r)}/{len(cdr_results)}")
+for key, value in cdr_cache.stats().items():
+    print(f"  {key}: {value}")
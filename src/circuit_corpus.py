@@ -0,0 +1,135 @@
+# Memory-mapped circuit corpus
+import json
+import os
+import time
+
+CORPUS_FORMAT_VERSION = 1
+CORPUS_COLUMNS = ['num_qubits', 'offsets', 'opcodes', 'operands', 'noise_scores', 'strategies']
+
+
+def _write_manifest(path, manifest):
+    tmp_path = os.path.join(path, 'manifest.json.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(path, 'manifest.json'))
+
+
+def _save_array(path, name, array):
+    # written aside and renamed: readers that still map the old file keep a consistent view
+    tmp_path = os.path.join(path, f"{name}.npy.tmp")
+    with open(tmp_path, 'wb') as f:
+        np.save(f, array)
+    os.replace(tmp_path, os.path.join(path, f"{name}.npy"))
+
+
+def save_corpus(path, corpus, features=None):
+    os.makedirs(path, exist_ok=True)
+    for column in CORPUS_COLUMNS:
+        _save_array(path, column, np.ascontiguousarray(corpus[column]))
+    if features is not None:
+        _save_array(path, 'features', np.ascontiguousarray(features, dtype=np.float64))
+
+    # the manifest is written last, so a half-written corpus cannot be opened
+    _write_manifest(path, {
+        'format_version': CORPUS_FORMAT_VERSION,
+        'num_circuits': int(len(corpus['num_qubits'])),
+        'num_gates': int(len(corpus['opcodes'])),
+        'gate_set': GATE_SET,
+        'strategy_classes': STRATEGY_CLASSES,
+        'feature_columns': list(FEATURE_COLUMNS) if features is not None else None,
+        'feature_schema': FEATURE_SCHEMA if features is not None else None,
+    })
+
+
+class CircuitCorpus:
+
+    def __init__(self, path, mmap_mode='r'):
+        self.path = path
+        self.mmap_mode = mmap_mode
+        with open(os.path.join(path, 'manifest.json')) as f:
+            self.manifest = json.load(f)
+
+        if self.manifest['format_version'] != CORPUS_FORMAT_VERSION:
+            raise ValueError(f"Unsupported corpus format version {self.manifest['format_version']} "
+                             f"(expected {CORPUS_FORMAT_VERSION})")
+        if self.manifest['gate_set'] != GATE_SET:
+            raise ValueError(f"Corpus gate set {self.manifest['gate_set']} does not match {GATE_SET}")
+
+        self._arrays = {
+            column: np.load(os.path.join(path, f"{column}.npy"), mmap_mode=mmap_mode)
+            for column in CORPUS_COLUMNS
+        }
+        features_path = os.path.join(path, 'features.npy')
+        self.features = np.load(features_path, mmap_mode=mmap_mode) if self.manifest['feature_columns'] else None
+
+    def __getstate__(self):
+        # workers reopen the memory map instead of receiving a copy of the arrays
+        return {'path': self.path, 'mmap_mode': self.mmap_mode}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'], state['mmap_mode'])
+
+    def __len__(self):
+        return self.manifest['num_circuits']
+
+    def __getitem__(self, column):
+        return self._arrays[column]
+
+    def circuit(self, index):
+        return build_circuit(self, index)
+
+    def iter_samples(self, start=0, stop=None):
+        stop = len(self) if stop is None else stop
+        for index in range(start, stop):
+            yield (self.circuit(index), float(self['noise_scores'][index]),
+                   self.manifest['strategy_classes'][self['strategies'][index]])
+
+    def feature_rows(self, indices):
+        if self.features is not None:
+            if self.manifest['feature_columns'] != FEATURE_COLUMNS:
+                raise ValueError(f"Corpus features {self.manifest['feature_columns']} do not match {FEATURE_COLUMNS}")
+            if self.manifest.get('feature_schema') != FEATURE_SCHEMA:
+                raise ValueError(f"Corpus features were computed with schema {self.manifest.get('feature_schema')}, "
+                                 f"not {FEATURE_SCHEMA}; rerun write_corpus_features")
+            return np.asarray(self.features[indices])
+        selected = np.arange(len(self))[indices]
+        rows, _ = extract_features_batch(self.circuit(int(i)) for i in np.atleast_1d(selected))
+        # shaped like indexing the stored array: an integer index gives a single 1-D row
+        return rows[0] if selected.ndim == 0 else rows
+
+
+def write_corpus_features(path, chunk_size=4096):
+    corpus = CircuitCorpus(path)
+    manifest = corpus.manifest
+    # filled in a temporary file: the live features.npy may still be mapped by open corpora
+    tmp_path = os.path.join(path, 'features.npy.tmp')
+    features = np.lib.format.open_memmap(
+        tmp_path, mode='w+', dtype=np.float64, shape=(len(corpus), len(FEATURE_COLUMNS)),
+    )
+    for start in range(0, len(corpus), chunk_size):
+        stop = min(start + chunk_size, len(corpus))
+        features[start:stop], _ = extract_features_batch(corpus.circuit(i) for i in range(start, stop))
+    features.flush()
+    del features, corpus
+
+    if manifest['feature_columns'] is not None and (manifest['feature_columns'] != list(FEATURE_COLUMNS)
+                                                    or manifest.get('feature_schema') != FEATURE_SCHEMA):
+        # the manifest must never describe features the file on disk does not have
+        _write_manifest(path, {**manifest, 'feature_columns': None, 'feature_schema': None})
+    os.replace(tmp_path, os.path.join(path, 'features.npy'))
+    # the manifest is still written last
+    _write_manifest(path, {**manifest, 'feature_columns': list(FEATURE_COLUMNS), 'feature_schema': FEATURE_SCHEMA})
+
+
+save_corpus('circuit_corpus', generated_corpus)
+write_corpus_features('circuit_corpus')
+
+start_time = time.time()
+corpus = CircuitCorpus('circuit_corpus')
+load_time = time.time() - start_time
+
+print("Circuit Corpus:")
+print(f"  Circuits: {len(corpus)}")
+print(f"  Load time: {load_time * 1000:.2f} ms")
+print(f"  First circuit depth: {corpus.circuit(0).depth()}")
+print(f"  Feature rows shape: {corpus.feature_rows(slice(0, 100)).shape}")
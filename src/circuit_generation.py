@@ -0,0 +1,115 @@
+# Multiprocess circuit and label generation
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+GATE_SET = ['h', 'x', 'y', 'z', 's', 't', 'cx', 'cy', 'cz']
+GATE_OPCODES = {name: i for i, name in enumerate(GATE_SET)}
+NUM_SINGLE_QUBIT_GATES = 6
+
+
+def _gate_depths(num_qubits, opcodes, operands):
+    levels = [0] * num_qubits
+    for opcode, (first, second) in zip(opcodes.tolist(), operands.tolist()):
+        if opcode < NUM_SINGLE_QUBIT_GATES:
+            levels[first] += 1
+        else:
+            level = max(levels[first], levels[second]) + 1
+            levels[first] = levels[second] = level
+    # measure_all adds one final layer
+    return max(levels) + 1
+
+
+def _generate_shard(master_seed, worker_index, num_circuits):
+    rng = np.random.default_rng(np.random.SeedSequence(master_seed, spawn_key=(worker_index,)))
+
+    num_qubits = rng.integers(2, 6, size=num_circuits)
+    num_gates = rng.integers(5, 20, size=num_circuits)
+    circuit_ids = np.repeat(np.arange(num_circuits), num_gates)
+
+    # one draw covers every gate of the shard; operands are scaled to each circuit's width
+    opcodes = rng.integers(0, len(GATE_SET), size=len(circuit_ids))
+    operands = (rng.random((len(circuit_ids), 2)) * num_qubits[circuit_ids, None]).astype(np.int64)
+    single = opcodes < NUM_SINGLE_QUBIT_GATES
+    operands[single, 1] = -1
+
+    # two-qubit gates with control == target are dropped, as in create_training_circuits
+    keep = single | (operands[:, 0] != operands[:, 1])
+    opcodes, operands, circuit_ids = opcodes[keep], operands[keep], circuit_ids[keep]
+    gate_counts = np.bincount(circuit_ids, minlength=num_circuits)
+    offsets = np.concatenate([[0], np.cumsum(gate_counts)])
+
+    depths = np.array([
+        _gate_depths(num_qubits[i], opcodes[offsets[i]:offsets[i + 1]], operands[offsets[i]:offsets[i + 1]])
+        for i in range(num_circuits)
+    ])
+
+    def per_circuit(name):
+        return np.bincount(circuit_ids[opcodes == GATE_OPCODES[name]], minlength=num_circuits)
+
+    noise_scores, strategies = noise_labels(
+        depths, num_qubits, gate_counts + num_qubits,
+        per_circuit('cx'), per_circuit('t'), per_circuit('h'),
+        rng.normal(0, 0.05, size=num_circuits),
+    )
+
+    return {
+        'num_qubits': num_qubits.astype(np.int8),
+        'offsets': offsets.astype(np.int64),
+        'opcodes': opcodes.astype(np.int8),
+        'operands': operands.astype(np.int8),
+        'noise_scores': noise_scores.astype(np.float64),
+        'strategies': np.searchsorted(STRATEGY_CLASSES, strategies).astype(np.int8),
+    }
+
+
+def _merge_shards(shards):
+    gate_totals = np.cumsum([0] + [shard['offsets'][-1] for shard in shards[:-1]])
+    return {
+        'num_qubits': np.concatenate([shard['num_qubits'] for shard in shards]),
+        'offsets': np.concatenate(
+            [[0]] + [shard['offsets'][1:] + base for shard, base in zip(shards, gate_totals)]
+        ).astype(np.int64),
+        'opcodes': np.concatenate([shard['opcodes'] for shard in shards]),
+        'operands': np.concatenate([shard['operands'] for shard in shards]),
+        'noise_scores': np.concatenate([shard['noise_scores'] for shard in shards]),
+        'strategies': np.concatenate([shard['strategies'] for shard in shards]),
+    }
+
+
+def generate_circuit_corpus(num_circuits, master_seed=0, num_workers=None):
+    # output is byte-identical for a given (master_seed, num_workers)
+    num_workers = num_workers or os.cpu_count() or 1
+    shard_sizes = [len(s) for s in np.array_split(np.arange(num_circuits), num_workers)]
+
+    if num_workers == 1:
+        shards = [_generate_shard(master_seed, 0, num_circuits)]
+    else:
+        with ProcessPoolExecutor(max_workers=num_workers) as pool:
+            shards = list(pool.map(_generate_shard, [master_seed] * num_workers, range(num_workers), shard_sizes))
+    return _merge_shards(shards)
+
+
+def build_circuit(corpus, index):
+    num_qubits = int(corpus['num_qubits'][index])
+    start, stop = corpus['offsets'][index], corpus['offsets'][index + 1]
+    circuit = QuantumCircuit(num_qubits, num_qubits)
+    for opcode, (first, second) in zip(corpus['opcodes'][start:stop].tolist(), corpus['operands'][start:stop].tolist()):
+        if opcode < NUM_SINGLE_QUBIT_GATES:
+            getattr(circuit, GATE_SET[opcode])(first)
+        else:
+            getattr(circuit, GATE_SET[opcode])(first, second)
+    circuit.measure_all()
+    return circuit
+
+
+def iter_corpus_samples(corpus):
+    for index in range(len(corpus['num_qubits'])):
+        yield (build_circuit(corpus, index), float(corpus['noise_scores'][index]),
+               STRATEGY_CLASSES[corpus['strategies'][index]])
+
+
+generated_corpus = generate_circuit_corpus(10000, master_seed=42, num_workers=4)
+print("Generated Corpus:")
+print(f"  Circuits: {len(generated_corpus['num_qubits'])}")
+print(f"  Gates: {len(generated_corpus['opcodes'])}")
+print(f"  Strategy distribution: {dict(zip(STRATEGY_CLASSES, np.bincount(generated_corpus['strategies'], minlength=4)))}")
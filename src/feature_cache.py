@@ -0,0 +1,146 @@
+# Structural-hash feature cache
+import hashlib
+import importlib
+import os
+import pickle
+from collections import OrderedDict
+
+
+def circuit_structural_hash(circuit):
+    qubit_index = {qubit: i for i, qubit in enumerate(circuit.qubits)}
+    clbit_index = {clbit: i for i, clbit in enumerate(circuit.clbits)}
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{circuit.num_qubits}:{circuit.num_clbits}".encode())
+    for instruction, qargs, cargs in circuit.data:
+        params = ','.join(repr(param) for param in instruction.params)
+        qubits = ','.join(str(qubit_index[q]) for q in qargs)
+        clbits = ','.join(str(clbit_index[c]) for c in cargs)
+        digest.update(f"|{instruction.name}({params})[{qubits}][{clbits}]".encode())
+        condition = getattr(instruction, 'condition', None)
+        if condition is not None:
+            # a conditioned gate is a different circuit from the same gate run unconditionally
+            read = ','.join(str(clbit_index[c]) for c in condition_clbits(condition))
+            value = condition[1] if isinstance(condition, tuple) else condition
+            digest.update(f"?[{read}]={value!r}".encode())
+    return digest.hexdigest()
+
+
+class FeatureCache:
+
+    def __init__(self, extractor, maxsize=4096, cache_dir=None):
+        self.extractor = extractor
+        self.maxsize = maxsize
+        self.cache_dir = cache_dir
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        # schema-tagged namespaces: rows cached under an older schema are never returned
+        package = importlib.import_module(type(extractor).__module__.split('.')[0])
+        self._features_namespace = f"features-{type(extractor).__name__}-{getattr(package, '__version__', '0')}"
+        self._row_namespace = f"feature_row-{FEATURE_SCHEMA}"
+
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _disk_path(self, namespace, key):
+        return os.path.join(self.cache_dir, f"{namespace}-{key}.pkl")
+
+    def _lookup(self, namespace, key, persist):
+        entry_key = (namespace, key)
+        if entry_key in self._entries:
+            self._entries.move_to_end(entry_key)
+            self.hits += 1
+            return True, self._entries[entry_key]
+
+        if persist and self.cache_dir is not None:
+            path = self._disk_path(namespace, key)
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    value = pickle.load(f)
+                self.disk_hits += 1
+                self._store(namespace, key, value, persist=False)
+                return True, value
+
+        self.misses += 1
+        return False, None
+
+    def _store(self, namespace, key, value, persist):
+        self._entries[(namespace, key)] = value
+        self._entries.move_to_end((namespace, key))
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+        if persist and self.cache_dir is not None:
+            path = self._disk_path(namespace, key)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+
+    def get_or_compute(self, circuit, namespace, compute, persist=False, key=None):
+        if key is None:
+            key = circuit_structural_hash(circuit)
+        found, value = self._lookup(namespace, key, persist)
+        if not found:
+            value = compute(circuit)
+            self._store(namespace, key, value, persist)
+        return value
+
+    def extract_features(self, circuit):
+        features = self.get_or_compute(circuit, self._features_namespace, self.extractor.extract_features,
+                                       persist=True)
+        return dict(features)
+
+    def _cached_row(self, circuit):
+        return self.get_or_compute(
+            circuit, self._row_namespace,
+            lambda c: _circuit_feature_row(c, np.zeros(len(FEATURE_COLUMNS))),
+            persist=True,
+        )
+
+    def feature_row(self, circuit):
+        return self._cached_row(circuit).copy()
+
+    def feature_matrix(self, circuits):
+        circuits = list(circuits)
+        matrix = np.zeros((len(circuits), len(FEATURE_COLUMNS)), dtype=np.float64)
+        for row, circuit in enumerate(circuits):
+            matrix[row] = self._cached_row(circuit)
+        return matrix
+
+    def predict_mitigation_strategy(self, suppressor, circuit):
+        # recommendations depend on the trained models: call clear() after retraining
+        return self.get_or_compute(circuit, 'recommendation', suppressor.predict_mitigation_strategy)
+
+    def clear(self, namespace=None):
+        if namespace is None:
+            self._entries.clear()
+        else:
+            for entry_key in [k for k in self._entries if k[0] == namespace]:
+                del self._entries[entry_key]
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'disk_hits': self.disk_hits,
+            'hit_rate': self.hits / lookups if lookups > 0 else 0.0,
+        }
+
+
+feature_cache = FeatureCache(extractor, maxsize=4096)
+
+# repeated circuits only pay for the structural hash
+for _ in range(3):
+    for cached_circuit in training_circuits[:10]:
+        feature_cache.extract_features(cached_circuit)
+        feature_cache.feature_row(cached_circuit)
+
+print("Feature Cache:")
+for key, value in feature_cache.stats().items():
+    print(f"  {key}: {value}")
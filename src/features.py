@@ -14,6 +14,8 @@ print("\nCircuit Diagram:")
 print(circuit.draw())
 
 
+from qiskit.circuit.random import random_circuit
+
 from hybrid_quantum_ml.features import FeatureExtractor
 
 extractor = FeatureExtractor()
@@ -27,3 +29,140 @@ print(f"  Single-qubit ratio: {features['single_qubit_ratio']:.3f}")
 print(f"  Entanglement ratio: {features['entanglement_ratio']:.3f}")
 
 print("\nFeature extracted")
+
+
+# Batch feature extraction
+import hashlib
+
+from qiskit.circuit import ClassicalRegister
+from qiskit.circuit.classical import expr
+
+FEATURE_COLUMNS = [
+    'num_qubits',
+    'depth',
+    'total_gates',
+    'single_qubit_gates',
+    'two_qubit_gates',
+    'single_qubit_ratio',
+    'two_qubit_ratio',
+    'connectivity_density',
+    'entanglement_ratio',
+]
+FEATURE_INDEX = {name: i for i, name in enumerate(FEATURE_COLUMNS)}
+# bump when a column's definition changes; adding, removing or reordering columns changes the schema anyway
+FEATURE_SCHEMA_VERSION = 2
+FEATURE_SCHEMA = f"v{FEATURE_SCHEMA_VERSION}-" + hashlib.blake2b(','.join(FEATURE_COLUMNS).encode(),
+                                                                 digest_size=4).hexdigest()
+
+NON_GATE_OPS = {'measure', 'barrier', 'reset', 'delay'}
+ENTANGLING_GATES = {'cx', 'cy', 'cz', 'ch', 'swap', 'iswap', 'ecr', 'cp', 'crx', 'cry', 'crz',
+                    'rxx', 'ryy', 'rzz', 'ccx', 'cswap'}
+
+
+def condition_clbits(condition):
+    # clbits read by a c_if-style (register/bit, value) condition or a classical expression
+    if condition is None:
+        return []
+    targets = [condition[0]] if isinstance(condition, tuple) else [var.var for var in expr.iter_vars(condition)]
+    clbits = []
+    for target in targets:
+        clbits.extend(target if isinstance(target, ClassicalRegister) else [target])
+    return clbits
+
+
+def _circuit_feature_row(circuit, out):
+    # single pass over circuit.data, written straight into a preallocated row
+    num_qubits = circuit.num_qubits
+    qubit_index = {qubit: i for i, qubit in enumerate(circuit.qubits)}
+    clbit_index = {clbit: num_qubits + i for i, clbit in enumerate(circuit.clbits)}
+    levels = [0] * (num_qubits + circuit.num_clbits)
+
+    total_gates = 0
+    single_qubit_gates = 0
+    two_qubit_gates = 0
+    entangling_gates = 0
+    pairs = set()
+
+    for instruction, qargs, cargs in circuit.data:
+        name = instruction.name
+        if name == 'barrier':
+            continue
+
+        bits = [qubit_index[q] for q in qargs]
+        wires = bits + [clbit_index[c] for c in cargs]
+        # like QuantumCircuit.depth(), a condition also advances the clbits it reads
+        for clbit in condition_clbits(getattr(instruction, 'condition', None)):
+            if clbit_index[clbit] not in wires:
+                wires.append(clbit_index[clbit])
+        if wires:
+            level = max(levels[w] for w in wires) + 1
+            for w in wires:
+                levels[w] = level
+
+        if name in NON_GATE_OPS:
+            continue
+
+        total_gates += 1
+        if len(bits) == 1:
+            single_qubit_gates += 1
+        elif len(bits) == 2:
+            two_qubit_gates += 1
+            pairs.add((min(bits), max(bits)))
+        if name in ENTANGLING_GATES:
+            entangling_gates += 1
+
+    max_pairs = num_qubits * (num_qubits - 1) / 2
+
+    out[0] = num_qubits
+    out[1] = max(levels) if levels else 0
+    out[2] = total_gates
+    out[3] = single_qubit_gates
+    out[4] = two_qubit_gates
+    out[5] = single_qubit_gates / total_gates if total_gates > 0 else 0
+    out[6] = two_qubit_gates / total_gates if total_gates > 0 else 0
+    out[7] = len(pairs) / max_pairs if max_pairs > 0 else 0
+    out[8] = entangling_gates / total_gates if total_gates > 0 else 0
+    return out
+
+
+def extract_features_batch(circuits, cache=None):
+    # cache: a FeatureCache, so repeated circuits only pay for their structural hash
+    if cache is not None:
+        return cache.feature_matrix(circuits), list(FEATURE_COLUMNS)
+    circuits = list(circuits)
+    features = np.zeros((len(circuits), len(FEATURE_COLUMNS)), dtype=np.float64)
+    for row, circuit in enumerate(circuits):
+        _circuit_feature_row(circuit, features[row])
+    return features, list(FEATURE_COLUMNS)
+
+
+def check_feature_parity(circuits, extractor):
+    # the batch path must reproduce extract_features bit for bit on every shared key
+    circuits = list(circuits)
+    batch, _ = extract_features_batch(circuits)
+    mismatches = []
+    for row, circuit in enumerate(circuits):
+        reference = extractor.extract_features(circuit)
+        for key in FEATURE_COLUMNS:
+            if key in reference and float(reference[key]) != batch[row, FEATURE_INDEX[key]]:
+                mismatches.append((row, key, reference[key], batch[row, FEATURE_INDEX[key]]))
+    if mismatches:
+        raise AssertionError(f"{len(mismatches)} batch features differ from extract_features, "
+                             f"e.g. (row, key, expected, got) = {mismatches[:5]}")
+    return len(circuits)
+
+
+batch_features, feature_columns = extract_features_batch([circuit])
+print("\nBatch Features:")
+print(f"  Shape: {batch_features.shape}")
+
+# varied widths, depths and gate sets, including measurements, resets and conditionals
+parity_circuits = [circuit] + [
+    random_circuit(width, depth, max_operands=3, measure=measure, reset=reset, conditional=conditional, seed=seed)
+    for seed, (width, depth, measure, reset, conditional) in enumerate([
+        (1, 5, True, False, False), (2, 8, True, False, False), (3, 10, False, True, False),
+        (4, 12, True, False, True), (5, 6, True, True, False), (6, 20, False, False, False),
+        (8, 15, True, False, False), (10, 4, True, True, True),
+    ])
+]
+print(f"  Circuits matching extract_features: {check_feature_parity(parity_circuits, extractor)}")
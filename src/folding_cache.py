@@ -0,0 +1,96 @@
+# Folding and transpilation cache for noise-scaled circuits
+import hashlib
+import time
+from collections import OrderedDict
+
+
+def backend_target_fingerprint(backend):
+    parts = [getattr(backend, 'name', None) or type(backend).__name__]
+    target = getattr(backend, 'target', None)
+    if target is not None:
+        parts.append(str(target.num_qubits))
+        parts.append(','.join(sorted(target.operation_names)))
+    return hashlib.blake2b('|'.join(parts).encode(), digest_size=16).hexdigest()
+
+
+class FoldingCache:
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._targets = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _target_key(self, backend):
+        entry = self._targets.get(id(backend))
+        if entry is None or entry[0] is not backend:
+            entry = self._targets[id(backend)] = (backend, backend_target_fingerprint(backend))
+        return entry[1]
+
+    def get_many(self, specs, backend):
+        # specs: (circuit, scale_factor) or (circuit, scale_factor, parameter_values);
+        # returned templates are shared between calls and must not be modified in place
+        target_key = self._target_key(backend)
+        circuit_keys = {}
+        templates = [None] * len(specs)
+        missing = OrderedDict()
+
+        for position, spec in enumerate(specs):
+            circuit, scale_factor = spec[0], spec[1]
+            circuit_key = circuit_keys.get(id(circuit))
+            if circuit_key is None:
+                circuit_key = circuit_keys[id(circuit)] = circuit_structural_hash(circuit)
+            key = (circuit_key, scale_factor, target_key)
+
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                templates[position] = self._entries[key]
+            else:
+                if key not in missing:
+                    self.misses += 1
+                    missing[key] = (circuit, scale_factor, [])
+                missing[key][2].append(position)
+
+        if missing:
+            folded = [fold_circuit(circuit, scale_factor) for circuit, scale_factor, _ in missing.values()]
+            transpiled = transpile(folded, backend, optimization_level=0)
+            for (key, (_, _, positions)), template in zip(missing.items(), transpiled):
+                self._entries[key] = template
+                for position in positions:
+                    templates[position] = template
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        # parameterized circuits are folded and transpiled once; only binding happens per call
+        return [
+            template.assign_parameters(spec[2]) if len(spec) > 2 and spec[2] is not None else template
+            for spec, template in zip(specs, templates)
+        ]
+
+    def clear(self):
+        self._entries.clear()
+        self._targets.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups > 0 else 0.0,
+        }
+
+
+folding_cache = FoldingCache(maxsize=1024)
+
+for attempt in range(2):
+    start_time = time.time()
+    execute_batch_with_mitigation(test_circuits, strategy='ZNE', shots=512, folding_cache=folding_cache)
+    print(f"Batch ZNE run {attempt + 1}: {time.time() - start_time:.2f}s")
+
+print("Folding Cache:")
+for key, value in folding_cache.stats().items():
+    print(f"  {key}: {value}")
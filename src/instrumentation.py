@@ -0,0 +1,157 @@
+# Pipeline instrumentation
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+PIPELINE_STAGES = [
+    'feature_extraction',
+    'ml_inference',
+    'circuit_transformation',
+    'transpilation',
+    'simulation',
+    'post_processing',
+]
+
+_DISABLED = nullcontext()
+
+
+class PipelineProfiler:
+
+    def __init__(self, enabled=False, max_events=100000):
+        self.enabled = enabled
+        self.events = deque(maxlen=max_events)
+        self._origin = time.perf_counter()
+        self._call_ids = itertools.count()
+        self._local = threading.local()
+
+    def stage(self, name, circuits=0, shots=0):
+        if not self.enabled:
+            return _DISABLED
+        return self._record(name, 'stage', circuits, shots)
+
+    def call(self, name, circuits=0, shots=0):
+        if not self.enabled:
+            return _DISABLED
+        return self._record(name, 'call', circuits, shots)
+
+    @contextmanager
+    def _record(self, name, kind, circuits, shots):
+        parent = getattr(self._local, 'call_id', None)
+        call_id = next(self._call_ids) if kind == 'call' else parent
+        if kind == 'call':
+            self._local.call_id = call_id
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.events.append({
+                'name': name,
+                'kind': kind,
+                'call_id': call_id,
+                'start': start - self._origin,
+                'duration': time.perf_counter() - start,
+                'circuits': circuits,
+                'shots': shots,
+                'pid': os.getpid(),
+                'tid': threading.get_ident(),
+            })
+            if kind == 'call':
+                self._local.call_id = parent
+
+    def summary(self, bins=20):
+        durations = {}
+        for event in self.events:
+            durations.setdefault(event['name'], []).append(event)
+
+        summary = {}
+        for name, events in durations.items():
+            seconds = np.array([event['duration'] for event in events])
+            # log-spaced bins cover microsecond stages and multi-second simulations alike
+            edges = np.geomspace(max(seconds.min(), 1e-7), max(seconds.max(), 1e-6), bins + 1)
+            counts, edges = np.histogram(np.clip(seconds, edges[0], edges[-1]), bins=edges)
+            summary[name] = {
+                'kind': events[0]['kind'],
+                'count': len(events),
+                'total_s': float(seconds.sum()),
+                'mean_ms': float(seconds.mean() * 1e3),
+                'p50_ms': float(np.percentile(seconds, 50) * 1e3),
+                'p90_ms': float(np.percentile(seconds, 90) * 1e3),
+                'p99_ms': float(np.percentile(seconds, 99) * 1e3),
+                'circuits': int(sum(event['circuits'] for event in events)),
+                'shots': int(sum(event['shots'] for event in events)),
+                'histogram': {'counts': counts.tolist(), 'edges_s': edges.tolist()},
+            }
+        return summary
+
+    def export_chrome_trace(self, path):
+        trace_events = [
+            {
+                'name': event['name'],
+                'cat': event['kind'],
+                'ph': 'X',
+                'ts': event['start'] * 1e6,
+                'dur': event['duration'] * 1e6,
+                'pid': event['pid'],
+                'tid': event['tid'],
+                'args': {'call_id': event['call_id'], 'circuits': event['circuits'], 'shots': event['shots']},
+            }
+            for event in self.events
+        ]
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': trace_events, 'displayTimeUnit': 'ms'}, f)
+
+    def reset(self):
+        self.events.clear()
+
+
+def instrument_suppressor(suppressor, profiler):
+    # the suppressor is a black box, so its calls are recorded as a whole
+    execute = suppressor.execute_with_mitigation
+    compare = suppressor.compare_strategies
+    predict = suppressor.predict_mitigation_strategy
+    performance_analysis = suppressor.get_performance_analysis
+
+    def execute_with_mitigation(circuit, *args, **kwargs):
+        with profiler.call('execute_with_mitigation', circuits=1, shots=kwargs.get('shots', 0)):
+            return execute(circuit, *args, **kwargs)
+
+    def compare_strategies(circuit, *args, **kwargs):
+        with profiler.call('compare_strategies', circuits=1, shots=kwargs.get('shots', 0)):
+            return compare(circuit, *args, **kwargs)
+
+    def predict_mitigation_strategy(circuit, *args, **kwargs):
+        with profiler.stage('ml_inference', circuits=1):
+            return predict(circuit, *args, **kwargs)
+
+    def get_performance_analysis(*args, **kwargs):
+        analysis = performance_analysis(*args, **kwargs)
+        if profiler.enabled:
+            analysis['stage_timings'] = profiler.summary()
+        return analysis
+
+    suppressor.execute_with_mitigation = execute_with_mitigation
+    suppressor.compare_strategies = compare_strategies
+    suppressor.predict_mitigation_strategy = predict_mitigation_strategy
+    suppressor.get_performance_analysis = get_performance_analysis
+    return suppressor
+
+
+profiler = PipelineProfiler(enabled=True)
+instrument_suppressor(suppressor, profiler)
+
+predict_mitigation_strategy_batch(test_circuits, strategy_selector, compiled=compiled_selector, profiler=profiler)
+execute_batch_with_mitigation(test_circuits, strategy='ZNE', shots=512, profiler=profiler)
+suppressor.execute_with_mitigation(test_circuit, strategy='ZNE', shots=1024)
+
+performance = suppressor.get_performance_analysis()
+print("Stage Timings:")
+for name, stats in performance.get('stage_timings', {}).items():
+    print(f"  {name}: {stats['count']} calls, p50 {stats['p50_ms']:.2f} ms, p99 {stats['p99_ms']:.2f} ms, "
+          f"{stats['circuits']} circuits, {stats['shots']} shots")
+
+profiler.export_chrome_trace('mitigation_trace.json')
+print("Chrome trace written to 'mitigation_trace.json'")
@@ -0,0 +1,176 @@
+# Shared measurement-error calibration
+import hashlib
+import json
+import time
+
+
+def noise_model_fingerprint(noise_model):
+    if noise_model is None:
+        return 'ideal'
+    payload = json.dumps(noise_model.to_dict(serializable=True), sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def outcome_bits(outcomes, num_bits):
+    # (n_outcomes, num_bits) array of 0/1, bit j of each outcome in column j
+    return ((np.asarray(outcomes, dtype=np.uint64)[:, None] >> np.arange(num_bits, dtype=np.uint64))
+            & np.uint64(1)).astype(np.int64)
+
+
+def counts_to_probability_matrix(counts_list, num_bits):
+    probabilities = np.zeros((len(counts_list), 2 ** num_bits))
+    for row, counts in enumerate(counts_list):
+        probabilities[row] = counts_to_probabilities(counts, num_bits)
+    return probabilities
+
+
+class CalibrationStore:
+
+    def __init__(self, ttl=3600.0, method='tensored', max_full_qubits=6, max_dense_bits=16):
+        if method not in ('tensored', 'full'):
+            raise ValueError(f"method must be 'tensored' or 'full', got {method!r}")
+        self.ttl = ttl
+        self.method = method
+        self.max_full_qubits = max_full_qubits
+        # wider tensored corrections work per observed outcome instead of on 2**n vectors
+        self.max_dense_bits = max_dense_bits
+        self._entries = {}
+        # id(noise_model) -> (noise_model, fingerprint); the model is held so its id cannot be reused.
+        # Noise models are treated as immutable once they have been used for calibration
+        self._fingerprints = {}
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, backend, qubits):
+        noise_model = getattr(getattr(backend, 'options', None), 'noise_model', None)
+        name = getattr(backend, 'name', None) or type(backend).__name__
+        return (name, self._fingerprint(noise_model), tuple(qubits))
+
+    def _fingerprint(self, noise_model):
+        # serializing a noise model costs far more than a lookup, and key() runs once per circuit
+        cached = self._fingerprints.get(id(noise_model))
+        if cached is None or cached[0] is not noise_model:
+            cached = self._fingerprints[id(noise_model)] = (noise_model, noise_model_fingerprint(noise_model))
+        return cached[1]
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry['created'] > self.ttl:
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def calibration_circuits(self, qubits):
+        # qubits[j] is measured into clbit j, i.e. bit j of the outcome index
+        qubits = list(qubits)
+        width = max(qubits) + 1
+        if self.method == 'tensored':
+            states = [0, 2 ** len(qubits) - 1]
+        else:
+            if len(qubits) > self.max_full_qubits:
+                raise ValueError(f"Full calibration limited to {self.max_full_qubits} qubits, got {len(qubits)}")
+            states = range(2 ** len(qubits))
+
+        circuits = []
+        for state in states:
+            circuit = QuantumCircuit(width, len(qubits))
+            for j, qubit in enumerate(qubits):
+                if (state >> j) & 1:
+                    circuit.x(qubit)
+            circuit.measure(qubits, range(len(qubits)))
+            circuits.append(circuit)
+        return circuits
+
+    def build(self, key, counts_list):
+        num_bits = len(key[2])
+
+        if self.method == 'tensored':
+            # per-bit marginals of the all-0 and all-1 preparations, from the observed outcomes only
+            marginals = []
+            for counts in counts_list:
+                outcomes, weights = counts_to_arrays(counts)
+                marginals.append(weights @ outcome_bits(outcomes, num_bits) / weights.sum())
+            p1_given_0, p1_given_1 = marginals
+            # matrices[j] = [[P(0|0), P(0|1)], [P(1|0), P(1|1)]] for bit j
+            matrices = np.stack([
+                np.stack([1 - p1_given_0, 1 - p1_given_1], axis=-1),
+                np.stack([p1_given_0, p1_given_1], axis=-1),
+            ], axis=1)
+            entry = {'matrices': matrices, 'inverses': np.linalg.inv(matrices)}
+        else:
+            matrix = counts_to_probability_matrix(counts_list, num_bits).T
+            entry = {'matrix': matrix, 'inverse': np.linalg.pinv(matrix)}
+
+        entry.update({'created': time.monotonic(), 'method': self.method, 'num_bits': num_bits})
+        self._entries[key] = entry
+        return entry
+
+    def calibrate(self, backend, qubits, shots=4096):
+        key = self.key(backend, qubits)
+        entry = self.get(key)
+        if entry is None:
+            circuits = transpile(self.calibration_circuits(qubits), backend, optimization_level=0)
+            job_result = backend.run(circuits, shots=shots).result()
+            entry = self.build(key, [job_result.get_counts(i) for i in range(len(circuits))])
+        return entry
+
+    @staticmethod
+    def _assignment_matrix(entry):
+        if entry['method'] == 'full':
+            return entry['matrix']
+        matrix = np.ones((1, 1))
+        for qubit_matrix in entry['matrices'][::-1]:
+            matrix = np.kron(matrix, qubit_matrix)
+        return matrix
+
+    def apply(self, entry, probabilities, correction='inverse'):
+        # probabilities: (n_vectors, 2**num_bits), corrected in one pass
+        probabilities = np.atleast_2d(np.asarray(probabilities, dtype=np.float64))
+        num_bits = entry['num_bits']
+
+        if correction == 'least_squares':
+            solution, _, _, _ = np.linalg.lstsq(self._assignment_matrix(entry), probabilities.T, rcond=None)
+            corrected = solution.T
+        elif correction != 'inverse':
+            raise ValueError(f"correction must be 'inverse' or 'least_squares', got {correction!r}")
+        elif entry['method'] == 'full':
+            corrected = probabilities @ entry['inverse'].T
+        else:
+            # apply each 2x2 inverse along its own bit axis of the reshaped tensor
+            tensor = probabilities.reshape((len(probabilities),) + (2,) * num_bits)
+            for bit, inverse in enumerate(entry['inverses']):
+                axis = num_bits - bit
+                tensor = np.moveaxis(np.tensordot(inverse, tensor, axes=([1], [axis])), 0, axis)
+            corrected = tensor.reshape(len(probabilities), -1)
+
+        corrected = np.clip(corrected, 0, None)
+        corrected /= corrected.sum(axis=1, keepdims=True)
+        return corrected
+
+    @staticmethod
+    def parity_expectation(entry, counts):
+        # <Z...Z> under the tensored inverse: the correction factorises over bits, so each observed
+        # outcome contributes prod_j (inv_j[0, b_j] - inv_j[1, b_j]) and no 2**n vector is formed.
+        # Unlike apply(), the quasi-probabilities are not clipped
+        outcomes, weights = counts_to_arrays(counts)
+        bits = outcome_bits(outcomes, entry['num_bits'])
+        factors = entry['inverses'][:, 0, :] - entry['inverses'][:, 1, :]
+        per_outcome = factors[np.arange(entry['num_bits']), bits].prod(axis=1)
+        return float(weights @ per_outcome / weights.sum())
+
+    def stats(self):
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses,
+                'ttl': self.ttl, 'method': self.method}
+
+
+calibration_store = CalibrationStore(ttl=3600.0)
+
+mem_results = execute_batch_with_mitigation(training_circuits[:10], strategy='MEM', shots=1024)
+print("MEM Calibration Store:")
+print(f"  Circuits mitigated: {sum(1 for r in mem_results if 'error' not in r)}/{len(mem_results)}")
+for key, value in calibration_store.stats().items():
+    print(f"  {key}: {value}")
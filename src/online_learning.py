@@ -0,0 +1,235 @@
+# Online retraining of the strategy selector from execution history; the offline noise predictor
+# is served as trained
+import copy
+import threading
+import time
+from collections import OrderedDict, deque
+
+
+def _execution_outcome(result):
+    # (achieved improvement, noise level) from a suppressor or batch result; None when not reported
+    improvement = _expectation_improvement(result)
+    if not isinstance(result, dict):
+        return improvement, None
+    outcome = result.get('mitigated_result') if isinstance(result.get('mitigated_result'), dict) else result
+    mitigated = outcome.get('expectation_value')
+    unmitigated = outcome.get('unmitigated_expectation')
+    if not isinstance(unmitigated, (int, float)):
+        return improvement, None
+    if improvement is None and isinstance(mitigated, (int, float)):
+        # noise shrinks parity expectations towards zero, so mitigation should restore magnitude
+        improvement = abs(mitigated) - abs(unmitigated)
+    return improvement, 1.0 - abs(unmitigated)
+
+
+class OnlineLearner:
+
+    def __init__(self, streaming_results, buffer_size=10000, batch_size=64, min_improvement=0.0, interval=1.0,
+                 feature_cache=None):
+        self.feature_cache = feature_cache
+        # the live models are never trained in place; updates work on copies that are swapped in whole.
+        # The scaler stays fixed: the noise predictor, trained offline on noise_score, is not updated
+        # online and must keep seeing the inputs it was fitted on
+        self.scaler = streaming_results['noise_predictor']['scaler']
+        self.noise_predictor = streaming_results['noise_predictor']['estimator']
+        # observed noise (1 - |unmitigated|) is another quantity on another scale than noise_score,
+        # so it gets its own regressor
+        self._models = (0, streaming_results['strategy_selector']['estimator'], None)
+        self.feature_columns = list(streaming_results['feature_columns'])
+        # oldest unprocessed observations are dropped if the trainer falls behind
+        self._buffer = deque(maxlen=buffer_size)
+        self._condition = threading.Condition()
+        self.batch_size = batch_size
+        self.min_improvement = min_improvement
+        # feature row -> {strategy: [improvement sum, count]}, so strategies run in different batches
+        # on the same circuit structure are still compared; least recently seen rows are evicted
+        self._observations = OrderedDict()
+        self.max_observations = buffer_size
+        self.interval = interval
+        self.samples_seen = 0
+        self.samples_trained = 0
+        self.last_update_s = 0.0
+        self._thread = None
+        self._stopping = False
+
+    @property
+    def version(self):
+        return self._models[0]
+
+    def start(self):
+        if self._thread is None:
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name='online-learner', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, flush=True):
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if flush:
+            self._update(self._drain())
+
+    def record(self, features, improvement, strategy, noise_level=None):
+        with self._condition:
+            self._buffer.append((np.asarray(features, dtype=np.float64), improvement, strategy, noise_level))
+            self.samples_seen += 1
+            if len(self._buffer) >= self.batch_size:
+                self._condition.notify()
+
+    def record_execution(self, circuit, result, strategy):
+        improvement, noise_level = _execution_outcome(result)
+        if improvement is None and noise_level is None:
+            return
+        features, _ = extract_features_batch([circuit], cache=self.feature_cache)
+        self.record(features[0], improvement, strategy, noise_level)
+
+    def predict_mitigation_strategy(self, circuit, top_k=3):
+        # one read of the model tuple: a concurrent swap can never mix two versions
+        version, strategy_selector, noise_level_model = self._models
+        features, _ = extract_features_batch([circuit], cache=self.feature_cache)
+        scaled = self.scaler.transform(features)
+        probabilities = strategy_selector.predict_proba(scaled)[0]
+        classes = strategy_selector.classes_.tolist()
+        top = np.argsort(-probabilities, kind='stable')[:top_k]
+        return {
+            'recommended_strategy': classes[int(np.argmax(probabilities))],
+            'strategy_probabilities': dict(zip(classes, probabilities.tolist())),
+            'top_strategies': [(classes[i], float(probabilities[i])) for i in top],
+            'predicted_noise': float(self.noise_predictor.predict(scaled)[0]),
+            'observed_noise_estimate': (float(noise_level_model.predict(scaled)[0])
+                                        if noise_level_model is not None else None),
+            'model_version': version,
+        }
+
+    def _drain(self):
+        with self._condition:
+            samples = list(self._buffer)
+            self._buffer.clear()
+        return samples
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._stopping or len(self._buffer) >= self.batch_size,
+                                         timeout=self.interval)
+                if self._stopping:
+                    return
+            self._update(self._drain())
+
+    def _update(self, samples):
+        if not samples:
+            return
+        start = time.perf_counter()
+        version, strategy_selector, noise_level_model = self._models
+        strategy_selector = copy.deepcopy(strategy_selector)
+        noise_level_model = (copy.deepcopy(noise_level_model) if noise_level_model is not None
+                             else SGDRegressor(random_state=42))
+
+        features = np.stack([sample[0] for sample in samples])
+        scaled = self.scaler.transform(features)
+
+        noisy = np.array([sample[3] is not None for sample in samples])
+        if noisy.any():
+            noise_levels = np.array([sample[3] for sample in samples if sample[3] is not None], dtype=np.float64)
+            noise_level_model.partial_fit(scaled[noisy], noise_levels)
+        elif self._models[2] is None:
+            noise_level_model = None
+
+        labelled = self._compare_strategies(samples)
+        if labelled:
+            rows = np.stack([row for row, _, _ in labelled])
+            strategy_selector.partial_fit(self.scaler.transform(rows), [label for _, label, _ in labelled],
+                                          classes=STRATEGY_CLASSES,
+                                          sample_weight=np.array([weight for _, _, weight in labelled]))
+
+        self._models = (version + 1, strategy_selector, noise_level_model)
+        self.samples_trained += len(samples)
+        self.last_update_s = time.perf_counter() - start
+
+    def _compare_strategies(self, samples):
+        # the label for a feature row is the strategy with the best mean improvement observed on it,
+        # weighted by its margin over the runner-up (or over min_improvement when only one was tried),
+        # so a strategy that merely runs most often is not reinforced for it
+        touched = {}
+        for features, improvement, strategy, _ in samples:
+            if improvement is None:
+                continue
+            key = features.tobytes()
+            observed = self._observations.pop(key, None) or {}
+            total = observed.setdefault(strategy, [0.0, 0])
+            total[0] += improvement
+            total[1] += 1
+            self._observations[key] = observed
+            touched[key] = features
+        while len(self._observations) > self.max_observations:
+            self._observations.popitem(last=False)
+
+        labelled = []
+        for key, features in touched.items():
+            observed = self._observations.get(key)
+            if observed is None:
+                continue
+            means = sorted(((total / count, strategy) for strategy, (total, count) in observed.items()), reverse=True)
+            best, strategy = means[0]
+            margin = best - (means[1][0] if len(means) > 1 else self.min_improvement)
+            if best > self.min_improvement and margin > 0:
+                labelled.append((features, strategy, margin))
+        return labelled
+
+    def stats(self):
+        return {
+            'version': self.version,
+            'buffered': len(self._buffer),
+            'samples_seen': self.samples_seen,
+            'samples_trained': self.samples_trained,
+            'observed_rows': len(self._observations),
+            'last_update_ms': self.last_update_s * 1e3,
+        }
+
+
+def enable_online_learning(suppressor, learner):
+    # existing wrappers (e.g. instrument_suppressor's ml_inference stage) stay in the call chain
+    execute = suppressor.execute_with_mitigation
+    predict = suppressor.predict_mitigation_strategy
+
+    def execute_with_mitigation(circuit, *args, **kwargs):
+        result = execute(circuit, *args, **kwargs)
+        strategy = kwargs.get('strategy', args[0] if args else None)
+        if strategy is not None:
+            learner.record_execution(circuit, result, strategy)
+        return result
+
+    def predict_mitigation_strategy(circuit, *args, **kwargs):
+        # the suppressor's recommendation schema is kept; the online model overrides its strategy fields
+        recommendation = dict(predict(circuit, *args, **kwargs))
+        recommendation.update(learner.predict_mitigation_strategy(circuit))
+        return recommendation
+
+    suppressor.execute_with_mitigation = execute_with_mitigation
+    suppressor.predict_mitigation_strategy = predict_mitigation_strategy
+    return suppressor
+
+
+online_learner = OnlineLearner(streaming_results, buffer_size=10000, batch_size=16,
+                               feature_cache=feature_cache).start()
+enable_online_learning(suppressor, online_learner)
+
+for strategy in ('ZNE', 'MEM'):
+    batch_results = execute_batch_with_mitigation(test_circuits, strategy=strategy, shots=512,
+                                                  backend=batch_backend)
+    for circuit, result in zip(test_circuits, batch_results):
+        online_learner.record_execution(circuit, result, strategy)
+for circuit in test_circuits:
+    suppressor.execute_with_mitigation(circuit, strategy='ZNE', shots=512)
+
+online_learner.stop(flush=True)
+recommendation = suppressor.predict_mitigation_strategy(test_circuit)
+
+print("Online Learning:")
+for key, value in online_learner.stats().items():
+    print(f"  {key}: {value}")
+print(f"  Recommended strategy: {recommendation['recommended_strategy']} (model v{recommendation['model_version']})")
@@ -0,0 +1,151 @@
+# Vectorized PEC quasi-probability sampling
+import itertools
+import math
+
+from qiskit.circuit.library import UnitaryGate
+from qiskit.quantum_info import Pauli
+from qiskit_aer.noise import NoiseModel, depolarizing_error
+
+PAULI_LABELS = 'IXYZ'
+# PAULI_ANTICOMMUTE[a, b] = 1 when single-qubit Paulis a and b anticommute
+PAULI_ANTICOMMUTE = np.array([[0, 0, 0, 0],
+                              [0, 0, 1, 1],
+                              [0, 1, 0, 1],
+                              [0, 1, 1, 0]])
+# sampled corrections are ideal: as labelled unitaries they match none of the gate names noise is keyed on
+PAULI_CORRECTIONS = {label: UnitaryGate(Pauli(label).to_matrix(), label=f'pec_{label.lower()}')
+                     for label in PAULI_LABELS[1:]}
+
+
+def pauli_channel_inverse(num_qubits, error_rate):
+    # depolarizing channel: every non-identity Pauli has fidelity 1 - error_rate;
+    # eta_Q = 4^-n * sum_P (-1)^<P,Q> / f_P gives the quasi-probabilities of the inverse
+    labels = [''.join(p) for p in itertools.product(PAULI_LABELS, repeat=num_qubits)]
+    codes = np.array([[PAULI_LABELS.index(c) for c in label] for label in labels])
+    anticommute = PAULI_ANTICOMMUTE[codes[:, None, :], codes[None, :, :]].sum(axis=2) & 1
+    signs = 1 - 2 * anticommute
+
+    fidelities = np.full(len(labels), 1 - error_rate)
+    fidelities[0] = 1.0
+    return labels, signs @ (1 / fidelities) / len(labels)
+
+
+class PECModel:
+
+    def __init__(self, gate_errors=None, default_1q_error=1e-3, default_2q_error=1e-2):
+        self.gate_errors = gate_errors or {}
+        self.default_1q_error = default_1q_error
+        self.default_2q_error = default_2q_error
+        self._tables = {}
+
+    def table(self, gate_name, num_qubits):
+        key = (gate_name, num_qubits)
+        if key not in self._tables:
+            default = self.default_1q_error if num_qubits == 1 else self.default_2q_error
+            labels, quasi = pauli_channel_inverse(num_qubits, self.gate_errors.get(gate_name, default))
+            gamma = np.abs(quasi).sum()
+            self._tables[key] = {
+                'labels': labels,
+                'quasi': quasi,
+                'gamma': gamma,
+                'cdf': np.cumsum(np.abs(quasi)) / gamma,
+                'negative': quasi < 0,
+            }
+        return self._tables[key]
+
+    def noise_model(self, gates):
+        # the Aer noise this model describes: depolarizing_error(p) leaves every non-identity Pauli
+        # with fidelity 1 - p, which is what pauli_channel_inverse cancels
+        noise_model = NoiseModel()
+        for gate_name, num_qubits in gates:
+            default = self.default_1q_error if num_qubits == 1 else self.default_2q_error
+            error = depolarizing_error(self.gate_errors.get(gate_name, default), num_qubits)
+            noise_model.add_all_qubit_quantum_error(error, [gate_name])
+        return noise_model
+
+
+def pec_required_samples(gamma, target_std_error):
+    # each signed sample is bounded by gamma, so its variance is at most gamma^2
+    return math.ceil((gamma / target_std_error) ** 2)
+
+
+def execute_pec(circuit, pec_model, num_samples=256, shots_per_sample=64, seed=None, backend=None):
+    # a given backend's noise must match pec_model, otherwise the inverse channel cancels noise
+    # that is not there; by default the noise is simulated from pec_model itself
+    rng = np.random.default_rng(seed)
+    # transpiled once, before sampling, so the corrections inserted below are never re-expressed
+    # in the (noisy) basis gates; the sampled locations are then the gates that actually run
+    unitary = transpile(circuit.remove_final_measurements(inplace=False),
+                        backend if backend is not None else AerSimulator(), optimization_level=0)
+
+    locations = {}
+    for position, (instruction, qargs, _) in enumerate(unitary.data):
+        if instruction.name not in NON_GATE_OPS and len(qargs) in (1, 2):
+            locations.setdefault((instruction.name, len(qargs)), []).append(position)
+
+    if backend is not None:
+        simulator = backend
+    else:
+        simulator = AerSimulator(noise_model=pec_model.noise_model(locations), seed_simulator=seed)
+
+    # one vectorized draw per gate type covers every instance and every location
+    columns = {}
+    choices = np.zeros((num_samples, len(unitary.data)), dtype=np.int64)
+    negative_count = np.zeros(num_samples, dtype=np.int64)
+    log_gamma = 0.0
+    for (gate_name, num_qubits), positions in locations.items():
+        table = pec_model.table(gate_name, num_qubits)
+        draws = np.searchsorted(table['cdf'], rng.random((num_samples, len(positions))), side='right')
+        draws = np.minimum(draws, len(table['cdf']) - 1)
+        choices[:, positions] = draws
+        negative_count += table['negative'][draws].sum(axis=1)
+        log_gamma += len(positions) * np.log(table['gamma'])
+        for position in positions:
+            columns[position] = table['labels']
+
+    gamma = float(np.exp(log_gamma))
+    signs = 1 - 2 * (negative_count & 1)
+
+    instances = []
+    for sample in range(num_samples):
+        instance = unitary.copy_empty_like()
+        for position, (instruction, qargs, cargs) in enumerate(unitary.data):
+            instance.append(instruction, qargs, cargs)
+            if choices[sample, position]:
+                for label, qubit in zip(columns[position][choices[sample, position]], qargs):
+                    if label != 'I':
+                        instance.append(PAULI_CORRECTIONS[label], [qubit])
+        instance.measure_all()
+        instances.append(instance)
+
+    # the unmitigated circuit rides along in the same job
+    baseline = unitary.copy()
+    baseline.measure_all()
+    instances.append(baseline)
+
+    job_result = simulator.run(instances, shots=shots_per_sample).result()
+    expectations = batch_parity_expectations([job_result.get_counts(i) for i in range(len(instances))])
+
+    weighted = gamma * signs * expectations[:-1]
+    variance = weighted.var(ddof=1) / num_samples if num_samples > 1 else float('inf')
+    return {
+        'strategy': 'PEC',
+        'expectation_value': float(weighted.mean()),
+        'unmitigated_expectation': float(expectations[-1]),
+        'gamma': gamma,
+        'sampling_overhead': gamma ** 2,
+        'variance': float(variance),
+        'std_error': float(np.sqrt(variance)),
+        'num_samples': num_samples,
+        'shots': num_samples * shots_per_sample + shots_per_sample,
+    }
+
+
+pec_model = PECModel(default_1q_error=1e-3, default_2q_error=1e-2)
+pec_result = execute_pec(test_circuit, pec_model, num_samples=256, shots_per_sample=64, seed=42)
+
+print("PEC Engine:")
+print(f"  Expectation value: {pec_result['expectation_value']:.4f} ± {pec_result['std_error']:.4f}")
+print(f"  Unmitigated: {pec_result['unmitigated_expectation']:.4f}")
+print(f"  Gamma: {pec_result['gamma']:.4f} (sampling overhead {pec_result['sampling_overhead']:.4f})")
+print(f"  Samples for ±0.01: {pec_required_samples(pec_result['gamma'], 0.01)}")
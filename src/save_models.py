@@ -9,3 +9,109 @@ new_suppressor.load_models("my_models")
 test_recommendation = new_suppressor.predict_mitigation_strategy(test_circuit)
 print(f"Loaded model recommendation: {test_recommendation['recommended_strategy']}")
 print("Model loaded successfully!")
+
+# Versioned model bundle
+import json
+import os
+import threading
+import time
+
+import joblib
+import sklearn
+
+MODEL_BUNDLE_VERSION = 1
+
+
+def save_model_bundle(path, models, feature_columns, metadata=None, feature_schema=FEATURE_SCHEMA):
+    os.makedirs(path, exist_ok=True)
+    entries = {}
+    for name, model in models.items():
+        filename = f"{name}.joblib"
+        # uncompressed, so numpy arrays inside the estimator can be memory-mapped on load
+        joblib.dump(model, os.path.join(path, filename), compress=0)
+        entries[name] = {'file': filename, 'class': type(model).__name__}
+
+    manifest = {
+        'format_version': MODEL_BUNDLE_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'sklearn_version': sklearn.__version__,
+        'feature_columns': list(feature_columns),
+        # the columns alone do not say how they were computed; the schema tag changes with the extractor
+        'feature_schema': feature_schema,
+        'models': entries,
+        'metadata': metadata or {},
+    }
+    tmp_path = os.path.join(path, 'manifest.json.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(path, 'manifest.json'))
+
+
+class ModelBundle:
+
+    def __init__(self, path, feature_columns=None, mmap_mode='r', feature_schema=FEATURE_SCHEMA):
+        self.path = path
+        self.mmap_mode = mmap_mode
+        with open(os.path.join(path, 'manifest.json')) as f:
+            self.manifest = json.load(f)
+
+        if self.manifest['format_version'] != MODEL_BUNDLE_VERSION:
+            raise ValueError(f"Unsupported model bundle version {self.manifest['format_version']} "
+                             f"(expected {MODEL_BUNDLE_VERSION})")
+        if feature_columns is not None:
+            self.check_schema(feature_columns, feature_schema)
+
+        self._models = {}
+        self._lock = threading.Lock()
+
+    def check_schema(self, feature_columns, feature_schema=FEATURE_SCHEMA):
+        expected = self.manifest['feature_columns']
+        feature_columns = list(feature_columns)
+        if feature_columns == expected:
+            if self.manifest.get('feature_schema') != feature_schema:
+                raise ValueError(f"Feature schema {feature_schema} does not match model bundle '{self.path}' "
+                                 f"({self.manifest.get('feature_schema')}): the same columns are computed differently")
+            return
+        missing = [c for c in expected if c not in feature_columns]
+        extra = [c for c in feature_columns if c not in expected]
+        detail = f"missing {missing}, unexpected {extra}" if missing or extra else "columns are in a different order"
+        raise ValueError(f"Feature schema does not match model bundle '{self.path}': {detail}")
+
+    def __getitem__(self, name):
+        model = self._models.get(name)
+        if model is None:
+            with self._lock:
+                model = self._models.get(name)
+                if model is None:
+                    entry = self.manifest['models'][name]
+                    model = joblib.load(os.path.join(self.path, entry['file']), mmap_mode=self.mmap_mode)
+                    self._models[name] = model
+        return model
+
+    def loaded_models(self):
+        return list(self._models)
+
+
+save_model_bundle(
+    'my_model_bundle',
+    {
+        'noise_predictor': streaming_results['noise_predictor']['model'],
+        'strategy_selector': streaming_results['strategy_selector']['model'],
+    },
+    streaming_results['feature_columns'],
+    metadata={
+        'samples': streaming_results['noise_predictor']['samples'],
+        'noise_predictor_r2': streaming_results['noise_predictor']['test_r2'],
+        'strategy_selector_accuracy': streaming_results['strategy_selector']['test_accuracy'],
+    },
+)
+
+start_time = time.time()
+model_bundle = ModelBundle('my_model_bundle', feature_columns=FEATURE_COLUMNS)
+test_features, _ = extract_features_batch([test_circuit])
+bundle_prediction = model_bundle['strategy_selector'].predict(test_features)[0]
+cold_start_time = time.time() - start_time
+
+print(f"Bundle recommendation: {bundle_prediction}")
+print(f"Cold start to first prediction: {cold_start_time * 1000:.1f} ms")
+print(f"Loaded models: {model_bundle.loaded_models()}")
@@ -0,0 +1,125 @@
+# Feature-based routing of circuits to Aer simulation methods
+import os
+from collections import Counter
+
+# gates the stabilizer method simulates exactly, plus non-unitary bookkeeping ops
+CLIFFORD_OPS = {'id', 'x', 'y', 'z', 'h', 's', 'sdg', 'sx', 'sxdg', 'cx', 'cy', 'cz', 'swap',
+                'measure', 'barrier', 'reset', 'delay'}
+FALLBACK_METHODS = {'stabilizer': 'statevector'}
+
+
+class SimulationRouter:
+
+    def __init__(self, noise_model=None, max_threads_per_job=None, max_dense_qubits=24, mps_min_qubits=12,
+                 mps_max_entanglement=0.15, density_matrix_max_qubits=10, seed=None, feature_cache=None):
+        self.noise_model = noise_model
+        self.feature_cache = feature_cache
+        # a thread cap per job leaves cores free for process-level parallelism across jobs
+        self.max_threads_per_job = max_threads_per_job or os.cpu_count() or 1
+        self.max_dense_qubits = max_dense_qubits
+        self.mps_min_qubits = mps_min_qubits
+        self.mps_max_entanglement = mps_max_entanglement
+        self.density_matrix_max_qubits = density_matrix_max_qubits
+        self.seed = seed
+        self._simulators = {}
+        self.method_counts = Counter()
+
+    @property
+    def backend(self):
+        # the generic simulator used when a caller needs a single target, e.g. for cache keys
+        return self.simulator('automatic')
+
+    def simulator(self, method):
+        if method not in self._simulators:
+            self._simulators[method] = AerSimulator(method=method, noise_model=self.noise_model,
+                                                    max_parallel_threads=self.max_threads_per_job,
+                                                    seed_simulator=self.seed)
+        return self._simulators[method]
+
+    def route(self, circuits):
+        circuits = list(circuits)
+        features, _ = extract_features_batch(circuits, cache=self.feature_cache)
+        methods = []
+        for circuit, row in zip(circuits, features):
+            num_qubits = int(row[FEATURE_INDEX['num_qubits']])
+            if set(circuit.count_ops()) <= CLIFFORD_OPS:
+                methods.append('stabilizer')
+            elif num_qubits > self.max_dense_qubits or (
+                    num_qubits >= self.mps_min_qubits
+                    and row[FEATURE_INDEX['entanglement_ratio']] <= self.mps_max_entanglement):
+                methods.append('matrix_product_state')
+            elif self.noise_model is not None and num_qubits <= self.density_matrix_max_qubits:
+                methods.append('density_matrix')
+            else:
+                methods.append('statevector')
+        return methods
+
+    def run(self, circuits, shots, needs_transpile=None, profiler=None, methods=None):
+        # needs_transpile: indices still to be transpiled, each against its own method's simulator;
+        # None transpiles everything. methods: routes already chosen (None entries are routed here),
+        # e.g. for circuits transpiled against router.simulator(method) by a folding cache
+        circuits = list(circuits)
+        methods = list(methods) if methods is not None else [None] * len(circuits)
+        unrouted = [i for i, method in enumerate(methods) if method is None]
+        if unrouted:
+            for i, method in zip(unrouted, self.route([circuits[i] for i in unrouted])):
+                methods[i] = method
+        groups = {}
+        for index, method in enumerate(methods):
+            groups.setdefault(method, []).append(index)
+
+        counts = [None] * len(circuits)
+        for method, indices in groups.items():
+            try:
+                self._run_group(method, circuits, indices, shots, needs_transpile, profiler, counts, methods)
+            except Exception:
+                # e.g. a noise model with non-Clifford errors on the stabilizer method
+                if method not in FALLBACK_METHODS:
+                    raise
+                # everything is re-transpiled: circuits may have been transpiled for the failed method
+                self._run_group(FALLBACK_METHODS[method], circuits, indices, shots, None, profiler,
+                                counts, methods)
+        return counts, methods
+
+    def _run_group(self, method, circuits, indices, shots, needs_transpile, profiler, counts, methods):
+        simulator = self.simulator(method)
+        batch = [circuits[i] for i in indices]
+        pending = [p for p, i in enumerate(indices) if needs_transpile is None or i in needs_transpile]
+        if pending:
+            with _stage(profiler, 'transpilation', circuits=len(pending)):
+                transpiled = transpile([batch[p] for p in pending], simulator, optimization_level=0)
+            for p, circuit in zip(pending, transpiled):
+                batch[p] = circuit
+
+        with _stage(profiler, 'simulation', circuits=len(batch), shots=shots * len(batch)):
+            job_result = simulator.run(batch, shots=shots).result()
+        for p, index in enumerate(indices):
+            counts[index] = job_result.get_counts(p)
+            # Aer reports the method it actually used
+            methods[index] = job_result.results[p].metadata.get('method', method)
+            self.method_counts[methods[index]] += 1
+
+    def stats(self):
+        return {'method_counts': dict(self.method_counts), 'max_threads_per_job': self.max_threads_per_job}
+
+
+router = SimulationRouter(max_threads_per_job=max(1, (os.cpu_count() or 1) // 2), seed=1234,
+                          feature_cache=feature_cache)
+
+# wide GHZ states are Clifford-only: trivial for the stabilizer method, out of reach for statevector
+ghz_circuits = []
+for width in (32, 48):
+    ghz = QuantumCircuit(width)
+    ghz.h(0)
+    for qubit in range(width - 1):
+        ghz.cx(qubit, qubit + 1)
+    ghz.measure_all()
+    ghz_circuits.append(ghz)
+
+routed_results = execute_batch_with_mitigation(test_circuits + ghz_circuits, strategy='ZNE', shots=512,
+                                               router=router)
+
+print("Simulation Router:")
+print(f"  Circuits mitigated: {sum(1 for r in routed_results if 'error' not in r)}/{len(routed_results)}")
+for method, count in router.method_counts.items():
+    print(f"  {method}: {count} circuits")
@@ -12,3 +12,126 @@ for strategy, prob in recommendation['strategy_probabilities'].items():
 print("\nTop 3 Strategies:")
 for i, (strategy, confidence) in enumerate(recommendation['top_strategies'], 1):
     print(f"  {i}. {strategy}: {confidence:.3f}")
+
+# Batched strategy inference
+import time
+from contextlib import nullcontext
+
+from scipy.special import expit
+from sklearn.ensemble import ExtraTreesClassifier, RandomForestClassifier
+from sklearn.linear_model import SGDClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+
+def _compile_tree(estimator):
+    tree = estimator.tree_
+    value = tree.value[:, 0, :]
+    value = value / value.sum(axis=1, keepdims=True)
+    return tree.children_left, tree.children_right, tree.feature, tree.threshold, value, tree.max_depth
+
+
+def _tree_proba(compiled_tree, X):
+    left, right, feature, threshold, value, max_depth = compiled_tree
+    rows = np.arange(len(X))
+    nodes = np.zeros(len(X), dtype=np.intp)
+    # all samples descend one level per step
+    for _ in range(max_depth):
+        internal = left[nodes] != -1
+        if not internal.any():
+            break
+        go_left = X[rows, feature[nodes]] <= threshold[nodes]
+        nodes = np.where(internal, np.where(go_left, left[nodes], right[nodes]), nodes)
+    return value[nodes]
+
+
+def compile_classifier(model):
+    # precompiled predict_proba that skips sklearn input validation; None if unsupported
+    scalers = []
+    if isinstance(model, Pipeline):
+        *steps, (_, model) = model.steps
+        for _, step in steps:
+            if not isinstance(step, StandardScaler):
+                return None
+            scalers.append((step.mean_ if step.with_mean else None, step.scale_ if step.with_std else None))
+
+    if isinstance(model, (RandomForestClassifier, ExtraTreesClassifier)):
+        trees = [_compile_tree(estimator) for estimator in model.estimators_]
+
+        def core(X):
+            # sklearn evaluates tree splits in float32
+            X = X.astype(np.float32)
+            return sum(_tree_proba(tree, X) for tree in trees) / len(trees)
+    elif isinstance(model, SGDClassifier) and model.loss == 'log_loss':
+        coef = model.coef_.T
+        intercept = model.intercept_
+
+        def core(X):
+            probabilities = expit(X @ coef + intercept)
+            if probabilities.shape[1] == 1:
+                return np.hstack([1 - probabilities, probabilities])
+            return probabilities / probabilities.sum(axis=1, keepdims=True)
+    else:
+        return None
+
+    def predict_proba(X):
+        X = np.asarray(X, dtype=np.float64)
+        for mean, scale in scalers:
+            if mean is not None:
+                X = X - mean
+            if scale is not None:
+                X = X / scale
+        return core(X)
+
+    predict_proba.classes_ = model.classes_
+    return predict_proba
+
+
+def predict_mitigation_strategy_batch(circuits, selector, top_k=3, compiled=None, profiler=None,
+                                      feature_cache=None):
+    circuits = list(circuits)
+    with profiler.stage('feature_extraction', circuits=len(circuits)) if profiler is not None else nullcontext():
+        features, _ = extract_features_batch(circuits, cache=feature_cache)
+    with profiler.stage('ml_inference', circuits=len(circuits)) if profiler is not None else nullcontext():
+        if compiled is not None:
+            probabilities = compiled(features)
+            classes = compiled.classes_
+        else:
+            probabilities = selector.predict_proba(features)
+            classes = selector.classes_
+
+    k = min(top_k, probabilities.shape[1])
+    top = np.argpartition(-probabilities, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(probabilities, top, axis=1), axis=1)
+    return {
+        'classes': np.asarray(classes),
+        'argmax': probabilities.argmax(axis=1),
+        'probabilities': probabilities,
+        'top_k': np.take_along_axis(top, order, axis=1),
+    }
+
+
+strategy_selector = model_bundle['strategy_selector']
+compiled_selector = compile_classifier(strategy_selector)
+# distinct circuits with no feature cache: every batch pays for feature extraction, as new traffic would
+inference_rng = np.random.default_rng(7)
+inference_circuits = [
+    random_circuit(int(inference_rng.integers(3, 7)), int(inference_rng.integers(3, 11)), measure=True, seed=seed)
+    for seed in range(1000)
+]
+batch_size = 100
+
+latencies = []
+for _ in range(5):
+    for start in range(0, len(inference_circuits), batch_size):
+        batch = inference_circuits[start:start + batch_size]
+        start_time = time.perf_counter()
+        batch_prediction = predict_mitigation_strategy_batch(batch, strategy_selector, compiled=compiled_selector)
+        latencies.append(time.perf_counter() - start_time)
+
+print(f"\nBatched Inference ({len(inference_circuits):,} distinct circuits, batches of {batch_size}):")
+print(f"  Fast path: {'compiled' if compiled_selector is not None else 'sklearn'}, cold feature extraction")
+print(f"  Per-batch latency p50: {np.percentile(latencies, 50) * 1e3:.2f} ms")
+print(f"  Per-batch latency p99: {np.percentile(latencies, 99) * 1e3:.2f} ms")
+print(f"  Per-circuit (p50 / batch size): {np.percentile(latencies, 50) / batch_size * 1e3:.4f} ms")
+print(f"  Recommended for first circuit of the last batch: {batch_prediction['classes'][batch_prediction['argmax'][0]]}")
@@ -1,82 +1,96 @@
 # Create training circuits
-def create_training_circuits(num_circuits=50): 
-    circuits = []
-    for i in range(num_circuits):
-       
-        num_qubits = np.random.randint(2, 6)
-        circuit = QuantumCircuit(num_qubits, num_qubits)
-        
-       
-        num_gates = np.random.randint(5, 20)
-        for _ in range(num_gates):
-            gate_type = np.random.choice(['h', 'x', 'y', 'z', 's', 't', 'cx', 'cy', 'cz'])
-            
-            if gate_type in ['h', 'x', 'y', 'z', 's', 't']:
-                qubit = np.random.randint(num_qubits)
-                getattr(circuit, gate_type)(qubit)
-            else:  # Two-qubit gates
-                control = np.random.randint(num_qubits)
-                target = np.random.randint(num_qubits)
-                if control != target:
-                    getattr(circuit, gate_type)(control, target)
+def random_training_circuit():
+    num_qubits = np.random.randint(2, 6)
+    circuit = QuantumCircuit(num_qubits, num_qubits)
+    
+   
+    num_gates = np.random.randint(5, 20)
+    for _ in range(num_gates):
+        gate_type = np.random.choice(['h', 'x', 'y', 'z', 's', 't', 'cx', 'cy', 'cz'])
         
-        circuit.measure_all()
-        circuits.append(circuit)
+        if gate_type in ['h', 'x', 'y', 'z', 's', 't']:
+            qubit = np.random.randint(num_qubits)
+            getattr(circuit, gate_type)(qubit)
+        else:  # Two-qubit gates
+            control = np.random.randint(num_qubits)
+            target = np.random.randint(num_qubits)
+            if control != target:
+                getattr(circuit, gate_type)(control, target)
     
-    return circuits
+    circuit.measure_all()
+    return circuit
+
+
+def create_training_circuits(num_circuits=50): 
+    return [random_training_circuit() for _ in range(num_circuits)]
 
 #  training data
 training_circuits = create_training_circuits(50)
 print(f"Created {len(training_circuits)} training circuits")
+check_feature_parity(training_circuits, extractor)
 
 
 
+def noise_labels(depth, num_qubits, size, cx_count, t_count, h_count, noise):
+    # works on scalars or on arrays of per-circuit metrics
+    size = np.asarray(size, dtype=np.float64)
+    safe_size = np.where(size > 0, size, 1)
+    
+    # Calculate complexity metrics
+    two_qubit_ratio = np.where(size > 0, cx_count / safe_size, 0)
+    t_gate_ratio = np.where(size > 0, t_count / safe_size, 0)
+    h_gate_ratio = np.where(size > 0, h_count / safe_size, 0)
+    
+   
+    noise_score = (
+        depth * 0.15 +                    # Depth penalty
+        num_qubits * 0.08 +               # Qubit count penalty
+        two_qubit_ratio * 0.4 +           # Two-qubit gate penalty
+        t_gate_ratio * 0.3 +              # T-gate penalty
+        h_gate_ratio * 0.1 +              # H-gate penalty
+        noise                             # Small random noise
+    )
+    
+    
+    noise_score = np.maximum(0.1, noise_score)
+    
+  
+    strategy = np.select(
+        [
+            (noise_score > 0.8) & (two_qubit_ratio > 0.3),
+            (noise_score > 0.6) & (np.asarray(num_qubits) > 4),
+            (noise_score > 0.4) & (t_gate_ratio > 0.2),
+        ],
+        ['ZNE', 'MEM', 'PEC'],
+        default='CDR',
+    )
+    
+    return noise_score, strategy
+
+
+def label_circuit(circuit):
+    
+    gate_counts = {}
+    for instruction, _, _ in circuit.data:
+        gate_name = instruction.name
+        gate_counts[gate_name] = gate_counts.get(gate_name, 0) + 1
+    
+    noise_score, strategy = noise_labels(
+        circuit.depth(), circuit.num_qubits, circuit.size(),
+        gate_counts.get('cx', 0), gate_counts.get('t', 0), gate_counts.get('h', 0),
+        np.random.normal(0, 0.05),
+    )
+    return float(noise_score), str(strategy)
+
+
 def generate_improved_training_data(circuits):
    
     noise_scores = []
     optimal_strategies = []
     
     for circuit in circuits:
-       
-        depth = circuit.depth()
-        num_qubits = circuit.num_qubits
-        size = circuit.size()
-        
-       
-        gate_counts = {}
-        for instruction, _, _ in circuit.data:
-            gate_name = instruction.name
-            gate_counts[gate_name] = gate_counts.get(gate_name, 0) + 1
-        
-        # Calculate complexity metrics
-        two_qubit_ratio = gate_counts.get('cx', 0) / size if size > 0 else 0
-        t_gate_ratio = gate_counts.get('t', 0) / size if size > 0 else 0
-        h_gate_ratio = gate_counts.get('h', 0) / size if size > 0 else 0
-        
-       
-        noise_score = (
-            depth * 0.15 +                    # Depth penalty
-            num_qubits * 0.08 +               # Qubit count penalty
-            two_qubit_ratio * 0.4 +           # Two-qubit gate penalty
-            t_gate_ratio * 0.3 +              # T-gate penalty
-            h_gate_ratio * 0.1 +              # H-gate penalty
-            np.random.normal(0, 0.05)         # Small random noise
-        )
-        
-        
-        noise_score = max(0.1, noise_score)
+        noise_score, strategy = label_circuit(circuit)
         noise_scores.append(noise_score)
-        
-      
-        if noise_score > 0.8 and two_qubit_ratio > 0.3:
-            strategy = 'ZNE'
-        elif noise_score > 0.6 and num_qubits > 4:
-            strategy = 'MEM'
-        elif noise_score > 0.4 and t_gate_ratio > 0.2:
-            strategy = 'PEC'
-        else:
-            strategy = 'CDR'
-        
         optimal_strategies.append(strategy)
     
     return noise_scores, optimal_strategies
@@ -173,3 +187,92 @@ def validate_models():
 
 # Run validation
 validate_models()
+
+# Streaming training pipeline
+from sklearn.linear_model import SGDClassifier, SGDRegressor
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+STRATEGY_CLASSES = ['CDR', 'MEM', 'PEC', 'ZNE']
+
+
+def iter_training_samples(num_circuits):
+    for _ in range(num_circuits):
+        circuit = random_training_circuit()
+        noise_score, strategy = label_circuit(circuit)
+        yield circuit, noise_score, strategy
+
+
+def _chunked(iterable, chunk_size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def train_streaming(samples, chunk_size=256, noise_predictor=None, strategy_selector=None, feature_cache=None):
+    noise_predictor = noise_predictor if noise_predictor is not None else SGDRegressor(random_state=42)
+    strategy_selector = strategy_selector if strategy_selector is not None else SGDClassifier(loss='log_loss', random_state=42)
+    for model in (noise_predictor, strategy_selector):
+        if not hasattr(model, 'partial_fit'):
+            raise TypeError(f"{type(model).__name__} does not support partial_fit")
+
+    scaler = StandardScaler()
+    num_samples = 0
+    num_evaluated = 0
+    squared_error = 0.0
+    target_sum = 0.0
+    target_sq_sum = 0.0
+    correct = 0
+
+    # progressive validation: each chunk is scored before the models learn from it
+    for chunk in _chunked(samples, chunk_size):
+        circuits, scores, strategies = zip(*chunk)
+        features, _ = extract_features_batch(circuits, cache=feature_cache)
+        y_noise = np.asarray(scores, dtype=np.float64)
+        y_strategy = np.asarray(strategies)
+
+        if num_samples > 0:
+            scaled = scaler.transform(features)
+            squared_error += np.sum((noise_predictor.predict(scaled) - y_noise) ** 2)
+            target_sum += y_noise.sum()
+            target_sq_sum += np.sum(y_noise ** 2)
+            correct += np.sum(strategy_selector.predict(scaled) == y_strategy)
+            num_evaluated += len(y_noise)
+
+        scaler.partial_fit(features)
+        scaled = scaler.transform(features)
+        noise_predictor.partial_fit(scaled, y_noise)
+        strategy_selector.partial_fit(scaled, y_strategy, classes=STRATEGY_CLASSES)
+        num_samples += len(y_noise)
+
+    total_variance = target_sq_sum - target_sum ** 2 / num_evaluated if num_evaluated > 0 else 0.0
+    return {
+        'noise_predictor': {
+            'model': make_pipeline(scaler, noise_predictor),
+            'scaler': scaler,
+            'estimator': noise_predictor,
+            'test_r2': 1 - squared_error / total_variance if total_variance > 0 else 0.0,
+            'samples': num_samples,
+        },
+        'strategy_selector': {
+            'model': make_pipeline(scaler, strategy_selector),
+            'scaler': scaler,
+            'estimator': strategy_selector,
+            'test_accuracy': correct / num_evaluated if num_evaluated > 0 else 0.0,
+            'samples': num_samples,
+        },
+        'feature_columns': list(FEATURE_COLUMNS),
+    }
+
+
+streaming_results = train_streaming(iter_training_samples(2000), chunk_size=256)
+
+print("\nStreaming Training:")
+print(f"  Samples: {streaming_results['noise_predictor']['samples']}")
+print(f"  Noise Predictor progressive R²: {streaming_results['noise_predictor']['test_r2']:.3f}")
+print(f"  Strategy Selector progressive accuracy: {streaming_results['strategy_selector']['test_accuracy']:.3f}")